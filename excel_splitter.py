@@ -3,26 +3,53 @@
 Excel Splitting Backend
 -----------------------
 • Pure logic only – no GUI
-• Reads an input .xlsx, reshapes the columns and
+• Opens the input .xlsx once (sheet XML parsed directly) for both the
+  MAWB in U9 and the data rows from row 10 on
+• Reshapes the columns and
   – fills Unit_Price = Total_Line_Value / Quantity (2-dec round)
   – bumps any Total_Line_Value < 1.00 up to 1.00
 • Writes out ≤499-row chunks with a header template
+  (parsed once per file/mtime – see load_template)
 • Saves <MAWB>_adjusted_rows.xlsx for rows that were bumped
   (values shown there are the *original* numbers, before bumping)
+• split_streaming() does the same in bounded memory for huge manifests
+• Either can trace its run and report the peak memory (memory_stats=)
 """
 
-import os, re, string
+import os, sys, hashlib, json, posixpath, string, tracemalloc, zipfile
+import xml.etree.ElementTree as ET
+from contextlib import closing, contextmanager
+from decimal import Decimal
+from itertools import islice
 from pathlib import Path
+from typing import Iterator, NamedTuple
 
+import numpy as np
 import pandas as pd
+import xlsxwriter
 from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
+from openpyxl.styles.numbers import (builtin_format_code, is_date_format,
+                                     is_timedelta_format)
+from openpyxl.utils.datetime import (CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900,
+                                     from_ISO8601, from_excel)
+from pandas.io.parsers import TextParser
 
 import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 # ─────────────── constants ────────────────────────────────────
 APP_DIR        = Path(__file__).resolve().parent
 HEADER_PATH    = APP_DIR / "Resources" / "ExcelSplitter" / "Header Sample.xlsx"
 ROWS_PER_FILE  = 495
+PARALLEL_MIN_PARTS = 8   # below this spawning a writer pool costs more than it saves
+
+# prepared-frame cache (next to the .exe when frozen, like generated_txts)
+RUN_DIR           = Path(sys.executable if getattr(sys, "frozen", False)
+                         else __file__).resolve().parent
+CACHE_DIR         = RUN_DIR / "cache" / "splitter"
+CACHE_MAX_BYTES   = 512 * 1024 * 1024
+TRANSFORM_VERSION = 1          # bump whenever transform_raw's output changes
 
 HEADERS = [
     "Invoice_No","Part","Commercial_Description","Country_of_Origin","Country_of_Export",
@@ -59,6 +86,13 @@ def xl_idx(col: str) -> int:
     return idx - 1
 
 
+_HEADERS_INDEX = pd.Index(HEADERS)
+
+TOTAL_COL = HEADERS[xl_idx("J")]   # Total_Line_Value
+QTY_COL   = HEADERS[xl_idx("G")]   # Quantity
+UNIT_COL  = HEADERS[xl_idx("I")]   # Unit_Price
+
+
 def get_mawb(path: str) -> str:
     wb   = load_workbook(path, read_only=True, data_only=True)
     mawb = str(wb.active["U9"].value).strip()
@@ -66,11 +100,282 @@ def get_mawb(path: str) -> str:
     return mawb
 
 
+# ───────────────── single-open reader ─────────────────────────
+MAWB_ROW, MAWB_COL = 9, xl_idx("U")      # U9
+HEADER_ROWS        = 9                   # data table starts at row 10
+
+
+def _convert_value(v):
+    """Mirror pandas' openpyxl cell conversion for a values-only read."""
+    if v is None:
+        return ""
+    if isinstance(v, float):
+        return int(v) if v.is_integer() else v
+    if isinstance(v, str) and v in ERROR_CODES:
+        return float("nan")
+    return v
+
+
+def _openpyxl_rows(path: str) -> Iterator[list]:
+    """Yield each first-sheet row as converted values, trailing blanks trimmed."""
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for row in wb.worksheets[0].iter_rows(values_only=True):
+            vals = [_convert_value(v) for v in row]
+            while vals and vals[-1] == "":
+                vals.pop()
+            yield vals
+    finally:
+        wb.close()
+
+
+# direct SpreadsheetML parse – same values as openpyxl's read-only
+# worksheet parser, without its per-cell objects and bookkeeping
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_DOC_RID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+
+class _SheetParts(NamedTuple):
+    sheet:    str                  # zip member of the first worksheet
+    strings:  list[str]            # shared-string table
+    dates:    frozenset[int]       # cellXfs indexes with a date format
+    deltas:   frozenset[int]       # … with an elapsed-time ([h]:mm) format
+    epoch:    datetime.datetime    # 1900 or 1904 date system
+
+
+def _rels(zf: zipfile.ZipFile, part: str) -> dict[str, tuple[str, str]]:
+    """Relationship id → (type, zip member) for *part*."""
+    base, name = posixpath.split(part)
+    try:
+        root = ET.fromstring(zf.read(f"{base}/_rels/{name}.rels".lstrip("/")))
+    except KeyError:
+        return {}
+    out = {}
+    for rel in root.iter(_PKG_REL):
+        target = rel.get("Target", "")
+        member = (target.lstrip("/") if target.startswith("/")
+                  else posixpath.normpath(posixpath.join(base, target)))
+        out[rel.get("Id")] = (rel.get("Type", ""), member)
+    return out
+
+
+def _text(node: ET.Element) -> str:
+    """Plain text of an <si> / <is> node: <t> plus rich-text runs, no phonetics."""
+    parts = []
+    for child in node:
+        if child.tag == f"{_MAIN_NS}t":
+            parts.append(child.text or "")
+        elif child.tag == f"{_MAIN_NS}r":
+            parts.append(child.findtext(f"{_MAIN_NS}t") or "")
+    return "".join(parts)
+
+
+def _workbook(zf: zipfile.ZipFile) -> tuple[ET.Element, dict, str, str] | None:
+    """
+    ``(workbook, rels, first, active)`` – the parsed workbook part, its
+    relationships and the zip members of the first worksheet (the one
+    read_excel reads) and of the active sheet (the one get_mawb reads).
+    None if the package is not plain SpreadsheetML.
+    """
+    doc = next((m for t, m in _rels(zf, "").values()
+                if t.endswith("/officeDocument")), None)
+    if doc is None:
+        return None
+    wb = ET.fromstring(zf.read(doc))
+    if wb.tag != f"{_MAIN_NS}workbook":              # strict OOXML etc.
+        return None
+
+    rels   = _rels(zf, doc)
+    sheets = [rels.get(s.get(_DOC_RID)) for s in wb.iter(f"{_MAIN_NS}sheet")]
+    first  = next((m for t, m in filter(None, sheets) if t.endswith("/worksheet")), None)
+    view   = wb.find(f"{_MAIN_NS}bookViews/{_MAIN_NS}workbookView")
+    active = int(view.get("activeTab", 0)) if view is not None else 0
+    if first is None or not sheets[min(active, len(sheets) - 1)]:
+        return None
+    return wb, rels, first, sheets[min(active, len(sheets) - 1)][1]
+
+
+def _active_is_first(path: str) -> bool:
+    """True when U9 of the table's sheet is the MAWB get_mawb would read."""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            book = _workbook(zf)
+    except zipfile.BadZipFile:
+        return False
+    return book is not None and book[2] == book[3]
+
+
+def _sheet_parts(zf: zipfile.ZipFile) -> _SheetParts | None:
+    """Locate the first worksheet and its lookups; None if not plain SpreadsheetML."""
+    book = _workbook(zf)
+    if book is None:
+        return None
+    wb, rels, sheet, _ = book
+
+    pr    = wb.find(f"{_MAIN_NS}workbookPr")
+    epoch = (CALENDAR_MAC_1904 if pr is not None
+             and pr.get("date1904", "").lower() in ("1", "true")
+             else CALENDAR_WINDOWS_1900)
+
+    strings: list[str] = []
+    dates, deltas = set(), set()
+    for kind, member in rels.values():
+        if kind.endswith("/sharedStrings"):
+            for _, node in ET.iterparse(zf.open(member)):
+                if node.tag == f"{_MAIN_NS}si":
+                    strings.append(_text(node).replace("x005F_", ""))
+                    node.clear()
+        elif kind.endswith("/styles"):
+            st     = ET.fromstring(zf.read(member))
+            custom = {int(f.get("numFmtId")): f.get("formatCode")
+                      for f in st.iter(f"{_MAIN_NS}numFmt")}
+            xfs    = st.find(f"{_MAIN_NS}cellXfs")
+            for i, xf in enumerate(xfs if xfs is not None else ()):
+                num = int(xf.get("numFmtId", 0))
+                fmt = custom.get(num) or builtin_format_code(num)
+                if fmt and is_date_format(fmt):
+                    dates.add(i)
+                if fmt and is_timedelta_format(fmt):
+                    deltas.add(i)
+    return _SheetParts(sheet, strings, frozenset(dates), frozenset(deltas), epoch)
+
+
+def _xml_rows(zf: zipfile.ZipFile, parts: _SheetParts) -> Iterator[list]:
+    """Rows of *parts.sheet* as openpyxl's values-only iterator reads them."""
+    ROW, CELL, VAL, INLINE = (f"{_MAIN_NS}{t}" for t in ("row", "c", "v", "is"))
+    strings, dates, deltas, epoch = parts[1:]
+    col_of: dict[str, int] = {}                   # "AB" → 27
+    row_no = 0
+
+    with zf.open(parts.sheet) as src:
+        for _, row in ET.iterparse(src):
+            if row.tag != ROW:
+                continue
+            r = row.get("r")
+            nxt = int(float(r)) if r else row_no + 1
+            for _ in range(row_no + 1, nxt):      # rows the file leaves out
+                yield []
+            row_no = nxt
+
+            vals: list = []
+            for cell in row:
+                if cell.tag != CELL:
+                    continue
+                ref = cell.get("r")
+                if ref:
+                    letters = ref.rstrip("0123456789")
+                    col = col_of.get(letters)
+                    if col is None:
+                        col = col_of[letters] = xl_idx(letters)
+                else:
+                    col = len(vals)
+                kind = cell.get("t", "n")
+                if kind == "inlineStr":
+                    node = cell.find(INLINE)
+                    v = _text(node) if node is not None else None
+                else:
+                    v = cell.findtext(VAL) or None
+                    if v is None:
+                        pass
+                    elif kind == "n":
+                        v = float(v) if ("." in v or "E" in v or "e" in v) else int(v)
+                        style = int(cell.get("s") or 0)
+                        if style in dates:
+                            try:
+                                v = from_excel(v, epoch, timedelta=style in deltas)
+                            except (OverflowError, ValueError):
+                                v = "#VALUE!"
+                    elif kind == "s":
+                        v = strings[int(v)]
+                    elif kind == "b":
+                        v = bool(int(v))
+                    elif kind == "d":
+                        v = from_ISO8601(v)
+                if col >= len(vals):
+                    vals.extend([""] * (col - len(vals)))
+                    vals.append(_convert_value(v))
+                else:
+                    vals[col] = _convert_value(v)
+            row.clear()
+            while vals and vals[-1] == "":
+                vals.pop()
+            yield vals
+
+
+def _sheet_rows(path: str) -> Iterator[list]:
+    """
+    Yield each row of the first worksheet as converted values, trailing
+    blanks trimmed.  The sheet XML is parsed directly; packages that
+    are not plain SpreadsheetML go through openpyxl instead.
+    """
+    try:
+        zf = zipfile.ZipFile(path)
+    except zipfile.BadZipFile:
+        yield from _openpyxl_rows(path)          # openpyxl's error message
+        return
+    with zf:
+        parts = _sheet_parts(zf)
+        if parts is None:
+            yield from _openpyxl_rows(path)
+        else:
+            yield from _xml_rows(zf, parts)
+
+
+def _mawb_from(path: str, rows: list[list]) -> str:
+    """
+    MAWB from U9 – str(None) when the cell is empty, like get_mawb.
+
+    *rows* are the first sheet's; when another sheet is active, get_mawb
+    reads U9 from that one instead.
+    """
+    if not _active_is_first(path):
+        return get_mawb(path)
+    row = rows[MAWB_ROW - 1] if len(rows) >= MAWB_ROW else []
+    val = row[MAWB_COL] if len(row) > MAWB_COL else ""
+    return str(None if val == "" else val).strip()
+
+
+def _parse_rows(data: list[list], width: int = 0, skiprows: int = 0,
+                dtype: dict | None = None) -> pd.DataFrame:
+    """Pad *data* to a common width and run pandas' Excel TextParser."""
+    width = max([width, *(len(r) for r in data)])
+    for r in data:
+        r.extend([""] * (width - len(r)))
+    with TextParser(data, header=0, skiprows=skiprows, dtype=dtype,
+                    skip_blank_lines=False) as parser:
+        return parser.read()
+
+
+def read_packing_list(path: str) -> tuple[str, pd.DataFrame]:
+    """
+    Open *path* once and return ``(mawb, raw)``.
+
+    `raw` is the same frame ``pd.read_excel(path, skiprows=9)`` gives
+    (first worksheet) and `mawb` is get_mawb's (active sheet), but when
+    those are the same sheet its XML is parsed a single time, directly
+    (see _sheet_rows), instead of once for U9 and again for the table
+    through openpyxl.
+    """
+    data, last_row = [], -1
+    for row_no, vals in enumerate(_sheet_rows(path)):
+        if vals:
+            last_row = row_no
+        data.append(vals)
+    data = data[: last_row + 1]
+
+    return _mawb_from(path, data), _parse_rows(data, skiprows=HEADER_ROWS)
+
+
 # ───────────────── dataframe prep ─────────────────────────────
 def prepare_dataframe(path: str) -> pd.DataFrame:
     # read starting at row 10 (skip first 9 rows)
-    raw = pd.read_excel(path, skiprows=9, engine="openpyxl")
+    _, raw = read_packing_list(path)
+    return transform_raw(raw)
+
 
+def transform_raw(raw: pd.DataFrame) -> pd.DataFrame:
+    """Reshape a raw packing-list frame into the `HEADERS` layout."""
     # detect commodity-description column (new layout)
     headers  = [str(h).lower() for h in raw.columns]
     has_desc = any("commodity" in h for h in headers)
@@ -94,56 +399,523 @@ def prepare_dataframe(path: str) -> pd.DataFrame:
     # drop rows that are completely blank
     base = pd.DataFrame(mapped).dropna(how="all").reset_index(drop=True)
 
-    # start full frame with all headers
-    df = pd.DataFrame(index=base.index, columns=HEADERS)
-    df.update(base)
+    # assemble every HEADERS column in one go (object dtype, NaN = blank)
+    blank = np.full(len(base), np.nan, dtype=object)
+    cols  = {
+        h: (base[h].to_numpy(dtype=object, na_value=np.nan)
+            if h in base else blank)
+        for h in HEADERS
+    }
+
+    df = pd.DataFrame(cols, index=base.index, dtype=object)
 
     # inject constants
     for tgt, val in CONSTANTS.items():
         df[HEADERS[xl_idx(tgt)]] = val
 
-    # SG / HK country overrides based on MID prefix
+    # SG / HK country overrides based on MID prefix (one upper-case pass)
     mid_c, cntry_c = HEADERS[xl_idx("T")], HEADERS[xl_idx("S")]
-    sg_mask = df[mid_c].astype(str).str.upper().str.startswith("SG", na=False)
-    hk_mask = df[mid_c].astype(str).str.upper().str.startswith("HK", na=False)
-    df.loc[sg_mask, cntry_c] = "SG"
-    df.loc[hk_mask, cntry_c] = "HK"
+    prefix = df[mid_c].astype(str).str[:2].str.upper()
+    df.loc[prefix == "SG", cntry_c] = "SG"
+    df.loc[prefix == "HK", cntry_c] = "HK"
 
     # pad ZIP codes to 6 digits
-    def _pad_zip(x):
-        if pd.isna(x):
-            return ""
-        s = str(x).strip()
-        m = re.fullmatch(r'(\d+)(?:\.0*)?', s)
-        return f"{int(m.group(1)):06d}" if m else s
-
     for zip_col in ("Manufacturer_Zip", "Buyer_Zip"):
         if zip_col in df.columns:
-            df[zip_col] = df[zip_col].apply(_pad_zip)
+            df[zip_col] = _pad_zips(df[zip_col])
 
     # ─────── calculate Unit_Price  (J / G) ───────
-    qty_col   = HEADERS[xl_idx("G")]   # Quantity
-    total_col = HEADERS[xl_idx("J")]   # Total_Line_Value
-    unit_col  = HEADERS[xl_idx("I")]   # Unit_Price
-
-    df[unit_col] = (
-        pd.to_numeric(df[total_col], errors="coerce") /
-        pd.to_numeric(df[qty_col],   errors="coerce")
+    df[UNIT_COL] = (
+        pd.to_numeric(df[TOTAL_COL], errors="coerce") /
+        pd.to_numeric(df[QTY_COL],   errors="coerce")
     ).round(2)
 
     return df
 
 
+_ZIP_RE = r"^([0-9]+)(?:\.0*)?$"       # 518000 / "518000" / 518000.0
+
+
+def _pad_zips(col: pd.Series) -> pd.Series:
+    """Vectorised ZIP padding: digits → 6-wide zero-filled, blanks → ''."""
+    out     = pd.Series("", index=col.index)
+    present = col.notna()
+    if present.any():
+        text   = col[present].astype(str).str.strip()
+        digits = text.str.extract(_ZIP_RE, expand=False)
+        padded = digits.str.lstrip("0").str.zfill(6)
+        out[present] = text.mask(digits.notna(), padded)
+    return out
+
+
+# ───────────────── compact frames / memory ────────────────────
+_NUMERIC_COLS = (QTY_COL, TOTAL_COL, UNIT_COL)   # bumped / divided later
+
+
+def compact_frame(df: pd.DataFrame, max_ratio: float = 0.5) -> pd.DataFrame:
+    """
+    Memory-lean copy of a prepared frame.
+
+    • all-blank columns are dropped – the writers re-create them from
+      the header template at write time (not _NUMERIC_COLS: the floor
+      bump reads and writes those)
+    • text columns with few distinct values (CONSTANTS, countries, MIDs,
+      manufacturer names …) become categoricals, so "CN" / "PCS" are
+      stored once plus one small code per row
+    Cell values written out are unchanged.
+    """
+    out = {}
+    for name, col in df.items():
+        if name not in _NUMERIC_COLS and col.isna().all():
+            continue
+        if (name not in _NUMERIC_COLS
+                and pd.api.types.infer_dtype(col, skipna=True) == "string"
+                and col.nunique(dropna=False) <= max(1, len(col) * max_ratio)):
+            col = col.astype("category")
+        out[name] = col
+    return pd.DataFrame(out, index=df.index)
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """Deep memory footprint of *df* in bytes."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+@contextmanager
+def memory_report(label: str = "split"):
+    """
+    Trace Python/numpy allocations for the block and print the peak.
+
+    Yields a dict that is filled with ``peak_bytes`` on exit.  tracemalloc
+    slows the run down noticeably – use it for diagnostics, not always-on.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base  = tracemalloc.get_traced_memory()[0]
+    stats: dict = {}
+    try:
+        yield stats
+    finally:
+        stats["peak_bytes"] = tracemalloc.get_traced_memory()[1] - base
+        if started:
+            tracemalloc.stop()
+        print(f"▶ {label}: peak {stats['peak_bytes'] / 2**20:.1f} MiB")
+
+
+# ───────────────── prepared-frame cache ───────────────────────
+def _file_digest(path: str | Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(1 << 20):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _evict(cache_dir: Path, max_bytes: int) -> None:
+    """
+    Drop least-recently-used entries until the cache fits *max_bytes*.
+
+    Inbox-watcher workers share the cache, so entries another worker has
+    already evicted are skipped rather than treated as errors.
+    """
+    entries = []
+    for e in cache_dir.glob("*.pkl"):
+        try:
+            st = e.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, e))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in entries:
+        if total <= max_bytes:
+            break
+        entry.unlink(missing_ok=True)
+        total -= size
+
+
+def load_prepared(
+    path: str,
+    *,
+    cache_dir: str | Path | None = None,
+    max_bytes: int = CACHE_MAX_BYTES,
+) -> tuple[str, pd.DataFrame]:
+    """
+    ``(mawb, prepared_df)`` for *path*, via an on-disk pickle cache.
+
+    Keyed on the file's SHA-256 plus `TRANSFORM_VERSION`, so re-running
+    the same packing list with other split options skips the read and
+    transform entirely.  Hits refresh the entry's mtime; the cache is
+    trimmed oldest-first to *max_bytes* after every store.
+    """
+    cache_dir = Path(cache_dir or CACHE_DIR)
+    entry = cache_dir / f"{_file_digest(path)}-v{TRANSFORM_VERSION}.pkl"
+
+    if entry.exists():
+        try:
+            mawb, df = pd.read_pickle(entry)
+        except Exception:                 # truncated / other pandas build
+            entry.unlink(missing_ok=True)
+        else:
+            try:
+                os.utime(entry)           # refresh LRU position
+            except FileNotFoundError:     # evicted by another worker meanwhile
+                pass
+            return mawb, df
+
+    mawb, raw = read_packing_list(path)
+    df = transform_raw(raw)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+    pd.to_pickle((mawb, df), tmp)
+    os.replace(tmp, entry)
+    _evict(cache_dir, max_bytes)
+    return mawb, df
+
+
+def clear_prepared_cache(cache_dir: str | Path | None = None) -> None:
+    for entry in Path(cache_dir or CACHE_DIR).glob("*.pkl"):
+        entry.unlink(missing_ok=True)
+
+
+# ───────────────── header template cache ──────────────────────
+# bold Times header row written on every GA_CI part
+HEADER_FORMAT = {
+    "bold": True, "font_name": "Times New Roman",
+    "font_size": 12, "align": "center", "valign": "center",
+}
+
+
+class HeaderTemplate(NamedTuple):
+    headers:   tuple[str, ...]           # column order of the GA_CI sheet
+    col_index: tuple[int | None, ...]    # HEADERS position per column (None = not ours)
+
+
+_TEMPLATE_CACHE: dict[str, tuple[int, HeaderTemplate]] = {}
+
+
+def load_template(path: str | Path | None = None) -> HeaderTemplate:
+    """
+    Return the header template for *path* (default `HEADER_PATH`).
+
+    Parsed once and cached per path; a newer mtime on disk triggers a
+    reload.  Batch callers can call this up front to warm the cache.
+    """
+    path  = Path(path or HEADER_PATH).resolve()
+    mtime = path.stat().st_mtime_ns
+    hit   = _TEMPLATE_CACHE.get(str(path))
+    if hit and hit[0] == mtime:
+        return hit[1]
+
+    wb = load_workbook(path, read_only=True)
+    try:
+        headers = tuple(cell.value for cell in wb.active[1] if cell.value)
+    finally:
+        wb.close()
+
+    pos = {h: i for i, h in enumerate(HEADERS)}
+    tpl = HeaderTemplate(headers, tuple(pos.get(h) for h in headers))
+    _TEMPLATE_CACHE[str(path)] = (mtime, tpl)
+    return tpl
+
+
+def clear_template_cache() -> None:
+    _TEMPLATE_CACHE.clear()
+
+
 # ───────────────── save chunks to disk ────────────────────────
-# ───────────────── save chunks to disk ────────────────────────
-# ───────────────── save chunks to disk ────────────────────────
+WRITE_ENGINES = ("pandas", "xlsxwriter")
+
+# number formats DataFrame.to_excel applies to date/time cells
+_DATETIME_FMT, _DATE_FMT = "YYYY-MM-DD HH:MM:SS", "YYYY-MM-DD"
+
+
+def _xl_cell(v):
+    """(value, num_format) for one cell, as DataFrame.to_excel writes it."""
+    if isinstance(v, (str, bool, int, Decimal)):
+        return v, None
+    if isinstance(v, float):
+        if v in (np.inf, -np.inf):
+            return ("inf" if v > 0 else "-inf"), None
+        return v, None
+    if isinstance(v, datetime.datetime):
+        return v, _DATETIME_FMT
+    if isinstance(v, datetime.date):
+        return v, _DATE_FMT
+    if isinstance(v, datetime.timedelta):
+        return v.total_seconds() / 86400, "0"
+    return str(v), None
+
+
+def _cell_values(col: pd.Series) -> list:
+    """Column values as a list, None where the cell stays blank."""
+    vals = col.tolist()
+    for r in np.flatnonzero(col.isna().to_numpy()):
+        vals[r] = None
+    return vals
+
+
+def _date_formats(wb: xlsxwriter.Workbook) -> dict:
+    return {f: wb.add_format({"num_format": f}) for f in (_DATETIME_FMT, _DATE_FMT, "0")}
+
+
+def _write_cells(ws, first_row: int, targets: list[int],
+                 columns: list[list], fmts: dict) -> int:
+    """Write *columns* row by row into sheet columns *targets*; return rows written."""
+    r = first_row - 1
+    for r, row in enumerate(zip(*columns), start=first_row):
+        for c, v in zip(targets, row):
+            if v is not None:
+                val, fmt = _xl_cell(v)
+                ws.write(r, c, val, fmts[fmt] if fmt else None)
+    return r + 1 - first_row
+
+
+def _write_direct(chunk: pd.DataFrame, invoice: str, xlsx_path: Path,
+                  template: HeaderTemplate) -> None:
+    """
+    Write one part straight from column arrays with xlsxwriter's
+    constant_memory mode – no reindexed copy, no pandas cell formatter.
+    Template columns we don't produce (col_index None) stay blank, as do
+    columns compact_frame() dropped.
+    """
+    index = template.col_index
+    if not chunk.columns.equals(_HEADERS_INDEX):        # compact frame
+        index = tuple(chunk.columns.get_loc(h) if h in chunk.columns else None
+                      for h in template.headers)
+    present = [(c, i) for c, i in enumerate(index) if i is not None]
+    columns = [_cell_values(chunk.iloc[:, i]) for _, i in present]
+    targets = [c for c, _ in present]
+
+    wb = xlsxwriter.Workbook(str(xlsx_path), {"constant_memory": True})
+    try:
+        ws   = wb.add_worksheet("Sheet1")
+        fmts = _date_formats(wb)
+        ws.write_row(0, 0, template.headers, wb.add_format(HEADER_FORMAT))
+        _write_cells(ws, 1, targets, columns, fmts)
+        ws.set_column(0, 0, max(len(invoice), len("Invoice_No")) + 2)
+        ws.set_column(5, 5, 20)
+    finally:
+        wb.close()
+
+
+def _apply_floor(chunk: pd.DataFrame) -> pd.DataFrame | None:
+    """Bump Total_Line_Value < $0.51 in place; return the original rows."""
+    mask = pd.to_numeric(chunk[TOTAL_COL], errors="coerce") < 0.51
+    if not mask.any():
+        return None
+    adjusted = chunk.loc[mask].copy()                         # originals
+    chunk.loc[mask, TOTAL_COL] = 0.51                         # bump
+    chunk.loc[mask, UNIT_COL] = (
+        pd.to_numeric(chunk.loc[mask, TOTAL_COL], errors="coerce") /
+        pd.to_numeric(chunk.loc[mask, QTY_COL],   errors="coerce")
+    ).round(2)
+    return adjusted
+
+
+def _write_part(
+    chunk: pd.DataFrame,
+    invoice: str,
+    xlsx_path: Path,
+    template: HeaderTemplate,
+    enforce_floor: bool,
+    engine: str = "pandas",
+) -> pd.DataFrame | None:
+    """
+    Apply the $0.51 floor to one chunk and write its GA_CI workbook.
+
+    Module-level so it can run inside a process-pool worker.
+    Returns the *original* bumped rows (or None) for the ADJUST log.
+    """
+    # ── optional price bump ────────────────────────────────────
+    adjusted = _apply_floor(chunk) if enforce_floor else None
+
+    # ── write split workbook ──────────────────────────────────
+    if engine == "xlsxwriter":
+        _write_direct(chunk, invoice, xlsx_path, template)
+        return adjusted
+
+    template_headers = list(template.headers)
+    chunk = chunk.reindex(columns=template_headers)
+
+    with pd.ExcelWriter(xlsx_path, engine="xlsxwriter") as writer:
+        chunk.to_excel(excel_writer=writer,
+                       index=False, header=False, startrow=1)
+        wb  = writer.book
+        ws  = writer.sheets["Sheet1"]
+        fmt = wb.add_format(HEADER_FORMAT)
+        for idx, title in enumerate(template_headers):
+            ws.write(0, idx, title, fmt)
+        ws.set_column(0, 0, max(len(invoice), len("Invoice_No")) + 2)
+        ws.set_column(5, 5, 20)
+
+    return adjusted
+
+
+def _part_dir(out_dir: str | Path, mawb: str) -> tuple[Path, str]:
+    """Create (and return) the MAWB-specific GA_CI sub-folder + date."""
+    date_str = datetime.date.today().strftime("%Y-%m-%d")
+    sub_dir  = Path(out_dir) / f"GA_CI_{mawb}_{date_str}"
+    sub_dir.mkdir(parents=True, exist_ok=True)
+    return sub_dir, date_str
+
+
+def _part_list(rows: int) -> list[str]:
+    """Invoice suffixes: A1, A2, B1 … for small parts, A … Z otherwise."""
+    return (
+        [f"{ltr}{i+1}" for ltr in string.ascii_uppercase for i in range(2)]
+        if rows < 600 else list(string.ascii_uppercase)
+    )
+
+
+def _write_adjust(
+    adj_rows: list[pd.DataFrame],
+    template_headers: list[str],
+    sub_dir: Path,
+    mawb: str,
+    date_str: str,
+) -> Path | None:
+    """Write the *_ADJUST.xlsx log (only if we actually bumped)."""
+    if not adj_rows:
+        return None
+    adj_df = (
+        pd.concat(adj_rows, ignore_index=True)
+          .reindex(columns=template_headers)
+    )
+    # restore original-unit prices in the log
+    adj_df[UNIT_COL] = (
+        pd.to_numeric(adj_df[TOTAL_COL], errors="coerce") /
+        pd.to_numeric(adj_df[QTY_COL],   errors="coerce")
+    ).round(2)
+
+    adj_name = f"GA_CI_{mawb}-ADJUST_{date_str}.xlsx"
+    adj_path = sub_dir / adj_name
+    adj_df.to_excel(excel_writer=adj_path, index=False)
+    return adj_path
+
+
+# header style DataFrame.to_excel gives the ADJUST log's first row
+_PANDAS_HEADER_FORMAT = {"bold": True, "border": 1, "align": "center", "valign": "top"}
+
+
+class _AdjustLog:
+    """
+    *_ADJUST.xlsx written part by part (constant_memory), so the bumped
+    originals of a streaming split never pile up in memory.  Same cells
+    as _write_adjust; the file is only created once a row is logged.
+    """
+
+    def __init__(self, path: Path, headers: list[str]):
+        self.path    = path
+        self.headers = headers
+        self._wb = self._ws = None
+        self._next = 1
+
+    def add(self, rows: pd.DataFrame) -> None:
+        adj = rows.reindex(columns=self.headers)
+        adj[UNIT_COL] = (                         # original-unit prices
+            pd.to_numeric(adj[TOTAL_COL], errors="coerce") /
+            pd.to_numeric(adj[QTY_COL],   errors="coerce")
+        ).round(2)
+        if self._wb is None:
+            self._wb   = xlsxwriter.Workbook(str(self.path), {"constant_memory": True})
+            self._ws   = self._wb.add_worksheet("Sheet1")
+            self._fmts = _date_formats(self._wb)
+            self._ws.write_row(0, 0, self.headers,
+                               self._wb.add_format(_PANDAS_HEADER_FORMAT))
+        columns = [_cell_values(adj.iloc[:, i]) for i in range(len(self.headers))]
+        self._next += _write_cells(self._ws, self._next, list(range(len(self.headers))),
+                                   columns, self._fmts)
+
+    def close(self) -> Path | None:
+        if self._wb is None:
+            return None
+        self._wb.close()
+        self._wb = None
+        return self.path
+
+    def discard(self) -> None:
+        if self._wb is not None:
+            self._wb.close()
+            self._wb = None
+            self.path.unlink(missing_ok=True)
+
+
+# ───────────────── split manifest ─────────────────────────────
+MANIFEST_NAME = "split_manifest.json"
+
+
+def _part_digest(chunk: pd.DataFrame, invoice: str, template: HeaderTemplate,
+                 enforce_floor: bool, engine: str) -> str:
+    """
+    Hash of everything that determines a part file's contents: the
+    options plus the cells as written – template column order, blanks
+    (NaN / None / missing column) all alike – so a compact and a full
+    frame of the same rows hash the same.
+    """
+    h = hashlib.sha256(
+        repr((invoice, template.headers, enforce_floor, engine, len(chunk))).encode()
+    )
+    for name in template.headers:
+        vals = _cell_values(chunk[name]) if name in chunk.columns else []
+        if not any(v is not None for v in vals):
+            vals = None                                   # blank column
+        h.update(repr((name, vals)).encode())
+    return h.hexdigest()
+
+
+def _read_manifest(sub_dir: Path) -> dict:
+    try:
+        with open(sub_dir / MANIFEST_NAME, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_current(entry: dict | None, xlsx_path: Path, digest: str) -> bool:
+    """True if *xlsx_path* is still the file the manifest recorded."""
+    if not entry or entry.get("sha256") != digest:
+        return False
+    try:
+        st = xlsx_path.stat()
+    except OSError:
+        return False
+    return st.st_size == entry.get("size") and st.st_mtime_ns == entry.get("mtime_ns")
+
+
+def _write_manifest(sub_dir: Path, old: dict, parts: dict[str, str],
+                    touched: list[str], adjust: str | None) -> None:
+    """Record per-part hashes; drop files the previous run left behind."""
+    for name in [*old.get("parts", {}), old.get("adjust")]:
+        if name and name not in parts and name != adjust:
+            (sub_dir / name).unlink(missing_ok=True)
+
+    entries = {}
+    for name, digest in parts.items():
+        st = (sub_dir / name).stat()
+        entries[name] = {"sha256": digest, "size": st.st_size,
+                         "mtime_ns": st.st_mtime_ns}
+    tmp = sub_dir / f"{MANIFEST_NAME}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"parts": entries, "adjust": adjust, "touched": touched},
+                  f, indent=2)
+    os.replace(tmp, sub_dir / MANIFEST_NAME)
+
+
 def save_chunks(
     df: pd.DataFrame,
     out_dir: str | Path,
     mawb: str,
     rows: int = ROWS_PER_FILE,
     *,                           # force kwargs after this
-    enforce_floor: bool = True   # ← checkbox state from GUI
+    enforce_floor: bool = True,  # ← checkbox state from GUI
+    parallel: bool = False,
+    engine: str = "pandas",
+    incremental: bool = False,
+    memory_stats: dict | None = None,
 ) -> int:
     """
     Split `df` into ≤rows-per-file workbooks.
@@ -153,88 +925,206 @@ def save_chunks(
     enforce_floor : bool
         If True:  bump any Total_Line_Value < $0.51 and log the originals.
         If False: leave values untouched and **don’t** create the *_ADJUST.xlsx.
+    parallel : bool
+        If True, write the part files on a process pool (one worker per
+        CPU) once there are PARALLEL_MIN_PARTS parts or more; smaller
+        splits and single-CPU machines stay sequential.  Output is
+        identical to the sequential path.
+    engine : {"pandas", "xlsxwriter"}
+        "pandas" goes through DataFrame.to_excel; "xlsxwriter" writes
+        the rows directly in constant_memory mode (same cell values,
+        inline strings instead of a shared-string table).
+    incremental : bool
+        If True, keep a split_manifest.json of per-part content hashes in
+        the output folder and only rewrite parts whose rows changed since
+        the last run (the rewritten names are printed and recorded).
+    memory_stats : dict, optional
+        Trace the run with memory_report() and store its ``peak_bytes``
+        here.  Only this process is traced, so pass parallel=False for a
+        figure that covers the part writes.
     """
-    out_dir = Path(out_dir)
+    if memory_stats is not None:
+        with memory_report(f"save_chunks {mawb}") as mem:
+            parts = save_chunks(df, out_dir, mawb, rows, enforce_floor=enforce_floor,
+                                parallel=parallel, engine=engine,
+                                incremental=incremental)
+        memory_stats.update(mem)
+        return parts
 
-    # ── build MAWB-specific sub-folder ─────────────────────────
-    date_str = datetime.date.today().strftime("%Y-%m-%d")
-    sub_dir  = out_dir / f"GA_CI_{mawb}_{date_str}"
-    sub_dir.mkdir(parents=True, exist_ok=True)
-
-    # suffix list
-    part_list = (
-        [f"{ltr}{i+1}" for ltr in string.ascii_uppercase for i in range(2)]
-        if rows < 600 else list(string.ascii_uppercase)
-    )
+    if engine not in WRITE_ENGINES:
+        raise ValueError(f"Unknown write engine: {engine!r}")
+    sub_dir, date_str = _part_dir(out_dir, mawb)
+    part_list = _part_list(rows)
     if len(df) > rows * len(part_list):
         raise ValueError("Too many rows for available file parts.")
 
-    # header template
-    template_headers = [
-        cell.value
-        for cell in load_workbook(HEADER_PATH, read_only=True).active[1]
-        if cell.value
-    ]
-
-    total_col = HEADERS[xl_idx("J")]   # Total_Line_Value
-    qty_col   = HEADERS[xl_idx("G")]   # Quantity
-    unit_col  = HEADERS[xl_idx("I")]   # Unit_Price
-
-    adj_rows: list[pd.DataFrame] = []
-    part = 0
-
-    for start in range(0, len(df), rows):
-        chunk   = df.iloc[start : start + rows].copy()
-        suffix  = part_list[part]
-        invoice = f"{mawb}-{suffix}"
-        chunk["Invoice_No"] = invoice
-
-        # ── optional price bump ────────────────────────────────
-        if enforce_floor:
-            mask = pd.to_numeric(chunk[total_col], errors="coerce") < 0.51
-            if mask.any():
-                adj_rows.append(chunk.loc[mask].copy())       # originals
-                chunk.loc[mask, total_col] = 0.51             # bump
-                chunk.loc[mask, unit_col] = (
-                    pd.to_numeric(chunk.loc[mask, total_col], errors="coerce") /
-                    pd.to_numeric(chunk.loc[mask, qty_col],   errors="coerce")
-                ).round(2)
-
-        # ── write split workbook ──────────────────────────────
-        chunk = chunk.reindex(columns=template_headers)
-        file_name = f"GA_CI_{invoice}_{date_str}.xlsx"
-        xlsx_path = sub_dir / file_name
-
-        with pd.ExcelWriter(xlsx_path, engine="xlsxwriter") as writer:
-            chunk.to_excel(excel_writer=writer,
-                           index=False, header=False, startrow=1)
-            wb  = writer.book
-            ws  = writer.sheets["Sheet1"]
-            fmt = wb.add_format({
-                "bold": True, "font_name": "Times New Roman",
-                "font_size": 12, "align": "center", "valign": "center",
-            })
-            for idx, title in enumerate(template_headers):
-                ws.write(0, idx, title, fmt)
-            ws.set_column(0, 0, max(len(invoice), len("Invoice_No")) + 2)
-            ws.set_column(5, 5, 20)
-
-        part += 1
-
-    # ── write adjustment workbook (only if we actually bumped) ─
-    if enforce_floor and adj_rows:
-        adj_df = (
-            pd.concat(adj_rows, ignore_index=True)
-              .reindex(columns=template_headers)
-        )
-        # restore original-unit prices in the log
-        adj_df[unit_col] = (
-            pd.to_numeric(adj_df[total_col], errors="coerce") /
-            pd.to_numeric(adj_df[qty_col],   errors="coerce")
-        ).round(2)
+    # header template (cached across runs, reloaded when the file changes)
+    template = load_template()
+
+    # incremental: parts whose hash still matches the manifest are kept
+    manifest = _read_manifest(sub_dir) if incremental else {}
+    digests: dict[str, str] = {}
+    touched: list[str] = []
+
+    part = -(-len(df) // rows)           # number of parts written
+    results: list[pd.DataFrame | None] = [None] * part
+
+    # one job per part; Invoice_No suffixes are fixed up front
+    def _jobs():
+        for i, start in enumerate(range(0, len(df), rows)):
+            chunk   = df.iloc[start : start + rows].copy()
+            invoice = f"{mawb}-{part_list[i]}"
+            chunk["Invoice_No"] = invoice
+            xlsx_path = sub_dir / f"GA_CI_{invoice}_{date_str}.xlsx"
+            if incremental:
+                digest = _part_digest(chunk, invoice, template,
+                                      enforce_floor, engine)
+                digests[xlsx_path.name] = digest
+                prev = manifest.get("parts", {}).get(xlsx_path.name)
+                if _is_current(prev, xlsx_path, digest):
+                    if enforce_floor:                # still feeds ADJUST
+                        results[i] = _apply_floor(chunk)
+                    continue
+            touched.append(xlsx_path.name)
+            yield i, (chunk, invoice, xlsx_path, template, enforce_floor, engine)
+
+    workers = min(part, os.cpu_count() or 1)
+    if parallel and workers > 1 and part >= PARALLEL_MIN_PARTS:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(i, pool.submit(_write_part, *job)) for i, job in _jobs()]
+            for i, fut in futures:
+                results[i] = fut.result()
+    else:
+        for i, job in _jobs():
+            results[i] = _write_part(*job)
+
+    # originals in part order, exactly as the sequential loop logs them
+    adj_rows: list[pd.DataFrame] = [r for r in results if r is not None]
 
-        adj_name = f"GA_CI_{mawb}-ADJUST_{date_str}.xlsx"
-        adj_path = sub_dir / adj_name
-        adj_df.to_excel(excel_writer=adj_path, index=False)
+    adj_path = _write_adjust(adj_rows, list(template.headers),
+                             sub_dir, mawb, date_str)
+
+    if incremental:
+        _write_manifest(sub_dir, manifest, digests, touched,
+                        adj_path.name if adj_path else None)
+        print(f"✔ Rewrote {len(touched)} of {part} part(s) under '{sub_dir.name}/'")
+        for name in touched:
+            print(f"  {name}")
 
     return part
+
+
+# ───────────────── streaming split ────────────────────────────
+def _batched(it: Iterator, n: int) -> Iterator[list]:
+    while batch := list(islice(it, n)):
+        yield batch
+
+
+def _sheet_head(sheet: Iterator[list]) -> tuple[list[list], list, int]:
+    """Take the title block and header row off *sheet*: (head, header, width)."""
+    head = list(islice(sheet, HEADER_ROWS + 1))
+    return (head, head[HEADER_ROWS] if len(head) > HEADER_ROWS else [],
+            max((len(r) for r in head), default=0))
+
+
+_KIND_FAMILY = {"i": "n", "u": "n", "f": "n"}    # numeric kinds that concat cleanly
+
+
+def _mixed_columns(path: str, rows: int) -> dict[str, type]:
+    """
+    ``{column: object}`` for columns TextParser types differently from
+    batch to batch.
+
+    The type of a column is inferred per frame, so a tariff column whose
+    first batch is all "0101210000" comes out as int there although the
+    whole sheet is text.  Parsing those columns as object keeps the
+    cells as read – what the whole-sheet parse does once inference fails.
+    One extra pass over the sheet; only the column kinds are kept.
+    """
+    kinds: dict[str, set] = {}
+    with closing(_sheet_rows(path)) as sheet:
+        _, header, width = _sheet_head(sheet)
+        for batch in _batched(sheet, rows):
+            for col, dt in _parse_rows([list(header), *batch], width).dtypes.items():
+                kinds.setdefault(col, set()).add(_KIND_FAMILY.get(dt.kind, dt.kind))
+    return {col: object for col, k in kinds.items() if len(k) > 1}
+
+
+def split_streaming(
+    path: str,
+    out_dir: str | Path,
+    rows: int = ROWS_PER_FILE,
+    *,
+    enforce_floor: bool = True,
+    engine: str = "pandas",
+    memory_stats: dict | None = None,
+) -> tuple[str, int]:
+    """
+    Constant-memory variant of read → transform → save_chunks.
+
+    Source rows are pulled from the sheet `rows` at a time, pushed
+    through `transform_raw` and written as soon as a GA_CI part fills;
+    its bumped originals go straight to the ADJUST log, so at most about
+    one part's worth of rows is held in memory.
+    Returns ``(mawb, parts_written)``.
+
+    Column types are settled in a first pass (see _mixed_columns), so
+    cell values written out are the same.  If the sheet outgrows
+    the available suffixes, the parts written so far are removed and
+    ValueError is raised, as save_chunks would have done up front.
+    *memory_stats* works as in save_chunks.
+    """
+    if memory_stats is not None:
+        with memory_report(f"split_streaming {Path(path).name}") as mem:
+            res = split_streaming(path, out_dir, rows, enforce_floor=enforce_floor,
+                                  engine=engine)
+        memory_stats.update(mem)
+        return res
+
+    if engine not in WRITE_ENGINES:
+        raise ValueError(f"Unknown write engine: {engine!r}")
+    template  = load_template()
+    part_list = _part_list(rows)
+    dtype     = _mixed_columns(path, rows) or None
+
+    with closing(_sheet_rows(path)) as sheet:
+        head, header, width = _sheet_head(sheet)
+        mawb = _mawb_from(path, head)
+
+        sub_dir, date_str = _part_dir(out_dir, mawb)
+        written: list[Path] = []
+        adjust  = _AdjustLog(sub_dir / f"GA_CI_{mawb}-ADJUST_{date_str}.xlsx",
+                             list(template.headers))
+
+        def _flush(chunk: pd.DataFrame) -> None:
+            if len(written) == len(part_list):
+                for done in written:
+                    done.unlink(missing_ok=True)
+                raise ValueError("Too many rows for available file parts.")
+            invoice = f"{mawb}-{part_list[len(written)]}"
+            chunk   = chunk.copy()
+            chunk["Invoice_No"] = invoice
+            xlsx_path = sub_dir / f"GA_CI_{invoice}_{date_str}.xlsx"
+            adjusted  = _write_part(chunk, invoice, xlsx_path,
+                                    template, enforce_floor, engine)
+            if adjusted is not None:
+                adjust.add(adjusted)
+            written.append(xlsx_path)
+
+        try:
+            pending = transform_raw(_parse_rows([list(header)], width, dtype=dtype))
+            for batch in _batched(sheet, rows):
+                df = transform_raw(_parse_rows([list(header), *batch], width,
+                                               dtype=dtype))
+                pending = pd.concat([pending, df], ignore_index=True)
+                while len(pending) >= rows:
+                    _flush(pending.iloc[:rows])
+                    pending = pending.iloc[rows:].reset_index(drop=True)
+            if len(pending):
+                _flush(pending)
+        except BaseException:
+            adjust.discard()
+            raise
+        adjust.close()
+
+    return mawb, len(written)
@@ -5,12 +5,22 @@ GA Broker Helper – File Renamer Tab
 • Parse user-pasted invoice ↔ entry mapping
 • Rename 3461 PDFs → '3461 Renamed/' (from original folder)
 • Rename 7501 PDFs → '7501 Renamed/' (from original folder)
+• One os.scandir pass per folder indexes every registered form type;
+  new forms (7512, ISF, …) plug in via register_doc_type()
+• Output by copy (default), hardlink, reflink or move – falling back to
+  a copy when the output folder is on another drive / filesystem
+• Form files are transferred on a thread pool (IO_WORKERS) with a
+  progress bar; per-file errors are collected, not fatal
+• Runs are journaled in '<mawb> renamed/rename_journal.jsonl' (sizes +
+  SHA-256) – resume skips verified outputs, dry run only prints the plan
 """
 from __future__ import annotations
 
-import os, platform, re, shutil, subprocess, threading, datetime
+import os, platform, re, shutil, subprocess, sys, threading, datetime, hashlib, json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Callable, NamedTuple, Optional
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
@@ -29,8 +39,173 @@ _MAWB_RE = re.compile(r"\b(\d{3}-\d{8})\b")
 _ENTRY_PATTERN = re.compile(r"(\d{8})")
 
 
-def _rename_packing_list(src_dir: Path) -> tuple[Path, str, str]:
-    excels = list(src_dir.glob("*.xls*"))
+# ──────────────── transfer modes ──────────────────────
+# hardlink: output shares the source's data – editing one edits both
+# reflink:  copy-on-write clone (Btrfs / XFS / APFS); independent copies
+# move:     source files leave the shipment folder
+TRANSFER_MODES = ("copy", "hardlink", "reflink", "move")
+_FICLONE = 0x40049409                       # Linux ioctl, <linux/fs.h>
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    if sys.platform.startswith("linux"):
+        import fcntl
+        try:
+            with open(src, "rb") as s, open(dst, "wb") as d:
+                fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        except OSError:
+            dst.unlink(missing_ok=True)
+            raise
+    elif sys.platform == "darwin":
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            raise OSError(ctypes.get_errno(), "clonefile failed")
+    else:
+        raise OSError("reflink is not supported on this platform")
+    shutil.copystat(src, dst)
+
+
+def transfer(src: Path, dst: Path, mode: str = "copy") -> str:
+    """
+    Put *src* at *dst* using *mode*; return the mode actually used.
+
+    hardlink / reflink fall back to "copy" when the link or clone is
+    refused (different device, FAT/exFAT, SMB, no CoW support); move
+    across devices becomes copy + delete ("copy+delete").
+
+    An existing *dst* is replaced in every mode.  If it is already a
+    hard link to *src* (an earlier hardlink run), hardlink keeps it,
+    move just drops the source name, and copy / reflink unlink it first
+    so the output becomes independent of the source.
+    """
+    if mode not in TRANSFER_MODES:
+        raise ValueError(f"Unknown transfer mode '{mode}' – use one of "
+                         + ", ".join(TRANSFER_MODES))
+    if dst.exists():
+        if dst.samefile(src):
+            if mode == "hardlink":
+                return mode
+            if mode == "move":
+                os.remove(src)
+                return mode
+        dst.unlink()                        # never write through an old link
+
+    if mode == "hardlink":
+        try:
+            os.link(src, dst)
+            return mode
+        except OSError:
+            pass
+    elif mode == "reflink":
+        try:
+            _reflink(src, dst)
+            return mode
+        except OSError:
+            pass
+    elif mode == "move":
+        try:
+            os.replace(src, dst)
+            return mode
+        except OSError:
+            shutil.copy2(src, dst)
+            os.remove(src)
+            return "copy+delete"
+
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+class Transfer(NamedTuple):
+    src:  Path
+    dst:  Path
+    kind: str           # "PL" or a form type key ("3461", "7501", …)
+
+
+def _report_modes(used: Counter, mode: str) -> None:
+    fallback = sum(n for m, n in used.items() if m != mode)
+    if fallback:
+        print(f"▶ {mode} not possible for {fallback} file(s) – copied instead")
+
+
+# ──────────────── document types ──────────────────────
+class DocType(NamedTuple):
+    key:      str                 # form number, e.g. "3461"
+    src_dir:  str                 # sub-folder of the shipment folder
+    out_dir:  str                 # sub-folder of '<mawb> renamed'
+    prefix:   str                 # output name: <prefix>_<mawb>-<invoice>_<date>
+    suffixes: tuple[str, ...]     # lower-case extensions picked up
+    required: bool                # missing src_dir is an error
+
+
+DOC_TYPES: dict[str, DocType] = {}
+
+
+def register_doc_type(key: str, *, src_dir: str | None = None,
+                      out_dir: str | None = None, prefix: str | None = None,
+                      suffixes: tuple[str, ...] = (".pdf",),
+                      required: bool = False) -> DocType:
+    """Add a form type; its files are indexed and renamed like 3461/7501."""
+    dt = DocType(key, src_dir or key, out_dir or f"{key} Renamed",
+                 prefix or f"GA_CF{key}", suffixes, required)
+    DOC_TYPES[key] = dt
+    return dt
+
+
+register_doc_type("3461", required=True)
+register_doc_type("7501", required=True)
+
+
+# ──────────────── shipment index ──────────────────────
+class ShipmentIndex(NamedTuple):
+    root:    Path
+    excels:  list[Path]                          # *.xls* directly in root
+    docs:    dict[str, dict[str, list[Path]]]    # type → entry# → files
+    missing: set[str]                            # types without a src folder
+
+
+def index_shipment(src_dir: Path,
+                   doc_types: dict[str, DocType] | None = None) -> ShipmentIndex:
+    """
+    Index a shipment folder with one directory listing per folder.
+
+    Entry numbers are the first 8-digit run in each file stem, leading
+    zeros dropped (as in the mapping).  Files of one entry keep listing
+    order.
+    """
+    doc_types = DOC_TYPES if doc_types is None else doc_types
+    by_dir    = {dt.src_dir.lower(): dt for dt in doc_types.values()}
+    excels, docs = [], {key: {} for key in doc_types}
+    missing = set(doc_types)
+
+    with os.scandir(src_dir) as it:
+        entries = list(it)
+    for e in entries:
+        if e.is_file():
+            if ".xls" in os.path.splitext(e.name)[1].lower():
+                excels.append(Path(e.path))
+            continue
+        dt = by_dir.get(e.name.lower()) if e.is_dir() else None
+        if dt is None:
+            continue
+        missing.discard(dt.key)
+        with os.scandir(e.path) as sub:
+            for f in sub:
+                if not f.is_file() or os.path.splitext(f.name)[1].lower() not in dt.suffixes:
+                    continue
+                match = _ENTRY_PATTERN.search(os.path.splitext(f.name)[0])
+                if match:
+                    entry = match.group(1).lstrip("0")
+                    docs[dt.key].setdefault(entry, []).append(Path(f.path))
+
+    return ShipmentIndex(Path(src_dir), excels, docs, missing)
+
+
+# ──────────────── rename steps ────────────────────────
+def _plan_packing_list(src_dir: Path,
+                       index: ShipmentIndex) -> tuple[Path, str, str, Transfer]:
+    """(out_root, mawb, date_str, packing-list transfer) – touches nothing."""
+    excels = index.excels
     if len(excels) != 1:
         raise FileNotFoundError("Expected 1 Excel packing list in folder.")
 
@@ -42,77 +217,377 @@ def _rename_packing_list(src_dir: Path) -> tuple[Path, str, str]:
     date_str = datetime.date.today().strftime("%Y-%m-%d")
 
     out_root = src_dir.parent / f"{mawb} renamed"
-    (out_root / "Packing List Renamed").mkdir(parents=True, exist_ok=True)
-    (out_root / "3461 Renamed").mkdir(exist_ok=True)
-    (out_root / "7501 Renamed").mkdir(exist_ok=True)
-
     new_name = f"GA_PL_{mawb}-1_{date_str}{pl_path.suffix}"
-    shutil.copy2(pl_path, out_root / "Packing List Renamed" / new_name)
-
-    return out_root, mawb, date_str
+    return (out_root, mawb, date_str,
+            Transfer(pl_path, out_root / "Packing List Renamed" / new_name, "PL"))
 
 
-def _parse_mapping(text: str, mawb: str) -> dict[str, str]:
-    pattern = re.compile(
-        rf"{re.escape(mawb)}-([A-Z])\s+([0-9]{{8}})"
-    )
-    mapping: dict[str, str] = {}
-    for line in text.splitlines():
-        m = pattern.search(line)
-        if m:
-            letter = m.group(1)
-            entry = m.group(2).lstrip("0")
-            mapping[entry] = letter
+def _make_out_dirs(out_root: Path) -> None:
+    (out_root / "Packing List Renamed").mkdir(parents=True, exist_ok=True)
+    for dt in DOC_TYPES.values():
+        (out_root / dt.out_dir).mkdir(exist_ok=True)
 
-    if not mapping:
-        raise ValueError("No MAWB-letter / entry-number pairs found.")
-    return mapping
 
+_PAIR_RE = re.compile(r"(\d{3}-\d{8})-([A-Z])\s+([0-9]{8})")
 
-def _rename_3461_pdfs(original_root: Path, output_root: Path, mawb: str, date_str: str, mapping: dict[str, str]) -> int:
-    src_dir = original_root / "3461"
-    dest_dir = output_root / "3461 Renamed"
-    count = 0
 
-    if not src_dir.exists():
-        raise FileNotFoundError(f"Missing folder:\n{src_dir}")
+def _parse_mappings(text: str) -> dict[str, dict[str, str]]:
+    """
+    Entry → invoice-letter maps for every MAWB in *text*, in one pass.
 
-    for file in src_dir.glob("*.pdf"):
-        match = _ENTRY_PATTERN.search(file.stem)
-        if not match:
-            continue
-        entry = match.group(1).lstrip("0")
-        invoice = mapping.get(entry)
-        if not invoice:
+    Only the first pair of each MAWB on a line counts, and a later line
+    overrides an earlier one for the same entry.
+    """
+    mappings: dict[str, dict[str, str]] = {}
+    for line in text.splitlines():
+        seen = set()
+        for m in _PAIR_RE.finditer(line):
+            mawb, letter, entry = m.groups()
+            if mawb in seen:
+                continue
+            seen.add(mawb)
+            mappings.setdefault(mawb, {})[entry.lstrip("0")] = letter
+    return mappings
+
+
+# ──────────────── transfer engine ─────────────────────
+IO_WORKERS = 8          # concurrent transfers – latency-bound on SMB shares
+
+
+class TransferReport(NamedTuple):
+    counts: Counter                       # kind → files transferred
+    modes:  Counter                       # mode actually used → files
+    errors: list[tuple[Transfer, str]]    # failed transfers with reason
+
+
+def _plan_documents(index: ShipmentIndex, output_root: Path, mawb: str,
+                    date_str: str, mapping: dict[str, str],
+                    doc_types: dict[str, DocType] | None = None) -> list[Transfer]:
+    """
+    Every mapped form file and its renamed destination.
+
+    A missing required form folder raises FileNotFoundError.  When
+    several files of one entry map to the same name the last one listed
+    wins, as the sequential copy loop did.
+    """
+    doc_types = DOC_TYPES if doc_types is None else doc_types
+    plan: dict[Path, Transfer] = {}
+    for dt in doc_types.values():
+        if dt.key in index.missing:
+            if dt.required:
+                raise FileNotFoundError(f"Missing folder:\n{index.root / dt.src_dir}")
             continue
-        new_name = f"GA_CF3461_{mawb}-{invoice}_{date_str}.pdf"
-        shutil.copy2(file, dest_dir / new_name)
-        count += 1
-
-    return count
-
+        dest_dir = output_root / dt.out_dir
+        for entry, files in index.docs[dt.key].items():
+            invoice = mapping.get(entry)
+            if not invoice:
+                continue
+            for file in files:
+                dst = dest_dir / f"{dt.prefix}_{mawb}-{invoice}_{date_str}{file.suffix.lower()}"
+                plan.pop(dst, None)
+                plan[dst] = Transfer(file, dst, dt.key)
+    return list(plan.values())
+
+
+# ──────────────── run journal ─────────────────────────
+JOURNAL_NAME = "rename_journal.jsonl"
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(1 << 20):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _stat_sig(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class Journal:
+    """
+    Append-only JSON-lines log of rename runs in '<mawb> renamed'.
+
+    'plan' lines list what a run is about to transfer; 'done' lines hold
+    the output's size and SHA-256 plus the source's size/mtime; 'error'
+    lines the reason.  Lines are flushed as they are written, so a crash
+    or dropped share loses at most the files still in flight.
+    """
+
+    def __init__(self, out_root: Path):
+        self.root = out_root
+        self.path = out_root / JOURNAL_NAME
+        self.run  = datetime.datetime.now().isoformat(timespec="seconds")
+        self.done: dict[str, dict] = {}          # output (relative) → last 'done'
+        self._fh = None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:            # torn last line after a crash
+                        continue
+                    if rec.get("op") == "done":
+                        self.done[rec["dst"]] = rec
+                    elif rec.get("op") == "error":
+                        self.done.pop(rec["dst"], None)
+        except FileNotFoundError:
+            pass
+
+    def _rel(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def _write(self, rec: dict) -> None:
+        if self._fh is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.path, "a", encoding="utf-8")
+        self._fh.write(json.dumps(rec) + "\n")
+        self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh:
+            self._fh.close()
+            self._fh = None
+
+    def log_plan(self, plan: list[Transfer], mode: str) -> None:
+        for t in plan:
+            sig = _stat_sig(t.src)
+            self._write({"op": "plan", "run": self.run, "mode": mode, "kind": t.kind,
+                         "src": str(t.src), "dst": self._rel(t.dst),
+                         "src_size": sig and sig[0]})
+
+    def log_done(self, t: Transfer, used: str, size: int, digest: str,
+                 src_sig: tuple[int, int] | None) -> None:
+        rec = {"op": "done", "run": self.run, "mode": used, "kind": t.kind,
+               "src": str(t.src), "dst": self._rel(t.dst), "size": size,
+               "sha256": digest, "src_size": src_sig and src_sig[0],
+               "src_mtime_ns": src_sig and src_sig[1]}
+        self.done[rec["dst"]] = rec
+        self._write(rec)
+
+    def log_error(self, t: Transfer, err: str) -> None:
+        self.done.pop(self._rel(t.dst), None)
+        self._write({"op": "error", "run": self.run, "kind": t.kind,
+                     "src": str(t.src), "dst": self._rel(t.dst), "error": err})
+
+    def verified(self, t: Transfer) -> bool:
+        """True if *t*'s output was completed from the unchanged source."""
+        rec = self.done.get(self._rel(t.dst))
+        if rec is None or rec["src"] != str(t.src):
+            return False
+        if _stat_sig(t.src) != (rec["src_size"], rec["src_mtime_ns"]):
+            return False
+        dst = _stat_sig(t.dst)
+        return dst is not None and dst[0] == rec["size"] and _sha256(t.dst) == rec["sha256"]
+
+
+def _transfer_logged(t: Transfer, mode: str) -> tuple[str, int, str, tuple[int, int] | None]:
+    # runs in a pool thread: transfer, then hash the output for the journal
+    src_sig = _stat_sig(t.src)
+    used = transfer(t.src, t.dst, mode)
+    return used, t.dst.stat().st_size, _sha256(t.dst), src_sig
+
+
+def run_transfers(
+    plan: list[Transfer],
+    mode: str = "copy",
+    *,
+    workers: int = IO_WORKERS,
+    progress: Callable[[int, int], None] | None = None,
+    journal: Journal | None = None,
+) -> TransferReport:
+    """
+    Execute *plan* on a thread pool of *workers*.
+
+    A failing file is recorded in the report's errors and the rest carry
+    on.  *progress(done, total)* is called from the calling thread after
+    each file.  With *journal*, every result is logged as it completes.
+    """
+    for d in {t.dst.parent for t in plan}:
+        d.mkdir(parents=True, exist_ok=True)
+
+    counts, modes, errors = Counter(), Counter(), []
+    job = _transfer_logged if journal else transfer
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futs = {(pool.submit(job, t, mode) if journal
+                 else pool.submit(job, t.src, t.dst, mode)): t for t in plan}
+        for done, fut in enumerate(as_completed(futs), 1):
+            t = futs[fut]
+            try:
+                res = fut.result()
+            except Exception as exc:
+                errors.append((t, str(exc)))
+                if journal:
+                    journal.log_error(t, str(exc))
+            else:
+                if journal:
+                    journal.log_done(t, *res)
+                    res = res[0]
+                modes[res] += 1
+                counts[t.kind] += 1
+            if progress:
+                progress(done, len(plan))
+
+    _report_modes(modes, mode)
+    return TransferReport(counts, modes, errors)
+
+
+# ──────────────── shipments ───────────────────────────
+SHIPMENT_WORKERS = 4    # shipments renamed at once in batch mode
+
+
+class ShipmentResult(NamedTuple):
+    folder:   Path
+    mawb:     str | None
+    out_root: Path | None
+    pairs:    int                          # mapping pairs for this MAWB
+    counts:   dict[str, int]               # form type → files renamed (planned if dry run)
+    errors:   list[str]                    # shipment error or per-file failures
+    skipped:  int = 0                      # verified-complete files left alone (resume)
+
+
+def rename_shipment(
+    src_dir: Path,
+    mappings: dict[str, dict[str, str]],
+    mode: str = "copy",
+    *,
+    io_workers: int = IO_WORKERS,
+    progress: Callable[[int, int], None] | None = None,
+    resume: bool = False,
+    dry_run: bool = False,
+) -> ShipmentResult:
+    """
+    Rename one shipment folder using the MAWB's entry in *mappings*.
+
+    Every run is journaled in '<mawb> renamed/rename_journal.jsonl'.
+    *resume* skips outputs the journal shows complete (same source
+    size/mtime, output size and SHA-256 re-checked); *dry_run* prints the
+    plan and touches nothing.
+    """
+    index = index_shipment(src_dir)
+    out_root, mawb, date_str, pl = _plan_packing_list(src_dir, index)
+    mapping = mappings.get(mawb)
+    if not mapping:
+        raise ValueError(f"No MAWB-letter / entry-number pairs found for {mawb}.")
+    plan = [pl] + _plan_documents(index, out_root, mawb, date_str, mapping)
 
-def _rename_7501_pdfs(original_root: Path, output_root: Path, mawb: str, date_str: str, mapping: dict[str, str]) -> int:
-    src_dir = original_root / "7501"
-    dest_dir = output_root / "7501 Renamed"
-    count = 0
+    journal = Journal(out_root)
+    if resume:
+        with ThreadPoolExecutor(max_workers=max(1, io_workers)) as pool:
+            complete = list(pool.map(journal.verified, plan))
+    else:
+        complete = [False] * len(plan)
+    todo = [t for t, ok in zip(plan, complete) if not ok]
+
+    if dry_run:
+        print("\n".join(
+            [f"▶ {mawb}: {len(todo)} to {mode}, {len(plan) - len(todo)} already done"]
+            + [f"  {'skip' if ok else mode:>8}  {t.kind:>4}  {t.src}  →  "
+               f"{t.dst.relative_to(out_root.parent)}" for t, ok in zip(plan, complete)]))
+        return ShipmentResult(src_dir, mawb, out_root, len(mapping),
+                              {key: sum(t.kind == key for t in todo) for key in DOC_TYPES},
+                              [], len(plan) - len(todo))
+
+    # The packing list goes last: a move run that stops early leaves it in
+    # the source folder, so the MAWB can still be read when resuming.
+    docs = [t for t in todo if t.kind != "PL"]
+    last = [t for t in todo if t.kind == "PL"]
+    def offset(start: int) -> Callable[[int, int], None] | None:
+        return (lambda done, _total: progress(start + done, len(todo))) if progress else None
+
+    _make_out_dirs(out_root)
+    try:
+        journal.log_plan(todo, mode)
+        report = run_transfers(docs, mode, workers=io_workers, progress=offset(0),
+                               journal=journal)
+        errors = [f"{t.src.name}: {err}" for t, err in report.errors]
+        if last and errors and mode == "move":
+            errors.append(f"{last[0].src.name}: left in place so the run can be resumed")
+        elif last:
+            pl_report = run_transfers(last, mode, workers=1, progress=offset(len(docs)),
+                                      journal=journal)
+            report.counts.update(pl_report.counts)
+            errors += [f"{t.src.name}: {err}" for t, err in pl_report.errors]
+    finally:
+        journal.close()
+    return ShipmentResult(
+        src_dir, mawb, out_root, len(mapping),
+        {key: report.counts[key] for key in DOC_TYPES},
+        errors,
+        len(plan) - len(todo),
+    )
 
-    if not src_dir.exists():
-        raise FileNotFoundError(f"Missing folder:\n{src_dir}")
 
-    for file in src_dir.glob("*.pdf"):
-        match = _ENTRY_PATTERN.search(file.stem)
-        if not match:
-            continue
-        entry = match.group(1).lstrip("0")
-        invoice = mapping.get(entry)
-        if not invoice:
-            continue
-        new_name = f"GA_CF7501_{mawb}-{invoice}_{date_str}.pdf"
-        shutil.copy2(file, dest_dir / new_name)
-        count += 1
+def _has_packing_list(folder: str) -> bool:
+    with os.scandir(folder) as it:
+        return any(e.is_file() and ".xls" in os.path.splitext(e.name)[1].lower()
+                   for e in it)
+
+
+def _shipment_dirs(parent: Path) -> tuple[list[Path], list[Path]]:
+    """
+    (shipment folders, other folders) among the sub-folders of *parent*.
+    Shipments hold an *.xls* packing list; '<mawb> renamed' outputs are
+    left out of both.
+    """
+    dirs, other = [], []
+    with os.scandir(parent) as it:
+        for e in sorted(it, key=lambda e: e.name):
+            if e.is_dir() and not e.name.endswith(" renamed"):
+                (dirs if _has_packing_list(e.path) else other).append(Path(e.path))
+    return dirs, other
+
+
+def batch_rename(
+    parent: str | Path,
+    mapping_text: str,
+    mode: str = "copy",
+    *,
+    workers: int = SHIPMENT_WORKERS,
+    io_workers: int = IO_WORKERS,
+    resume: bool = False,
+    dry_run: bool = False,
+) -> list[ShipmentResult]:
+    """
+    Rename every shipment folder under *parent* in parallel.
+
+    *mapping_text* holds the pairs of all MAWBs and is parsed once.  A
+    shipment that fails is returned with its error; the rest carry on.
+    """
+    parent   = Path(parent)
+    mappings = _parse_mappings(mapping_text)
+    folders, other = _shipment_dirs(parent)
+    for d in other:
+        print(f"· {d.name}: no packing list – skipped")
+    if not folders:
+        raise FileNotFoundError(f"No shipment folders in:\n{parent}")
+
+    results: dict[Path, ShipmentResult] = {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futs = {pool.submit(rename_shipment, d, mappings, mode, io_workers=io_workers,
+                            resume=resume, dry_run=dry_run): d
+                for d in folders}
+        for fut in as_completed(futs):
+            d = futs[fut]
+            try:
+                res = fut.result()
+            except Exception as exc:
+                res = ShipmentResult(d, None, None, 0, {}, [str(exc)])
+            results[d] = res
+            if not res.mawb:
+                print(f"✘ {d.name}: {res.errors[0]}")
+            elif not dry_run:                       # a dry run has printed its plan
+                print(f"{'✔' if not res.errors else '✘'} {res.mawb}: " + ", ".join(
+                    f"{n} × {key}" for key, n in res.counts.items())
+                    + (f", {res.skipped} already done" if res.skipped else "")
+                    + f" → {res.out_root}")
+    return [results[d] for d in folders]
 
-    return count
 
 # ──────────────── GUI tab ─────────────────────────────
 class FileRenamerTab:
@@ -164,6 +639,18 @@ class FileRenamerTab:
                                        command=self._open_folder, state="disabled")
         self._open_btn.pack(side="left", padx=10)
 
+        self._mode_var = ctk.StringVar(value="copy")
+        ctk.CTkOptionMenu(btn_row, width=110, values=list(TRANSFER_MODES),
+                          variable=self._mode_var).pack(side="left", padx=10)
+
+        self._resume_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(btn_row, text="Resume", variable=self._resume_var
+                        ).pack(side="left", padx=10)
+
+        self._progress = ctk.CTkProgressBar(parent, width=420)
+        self._progress.set(0)
+        self._progress.pack(pady=(4, 10))
+
     def _browse(self):
         p = filedialog.askdirectory(title="Select shipment folder")
         if p:
@@ -188,23 +675,33 @@ class FileRenamerTab:
             return
 
         mapping_text = self._map_text.get("1.0", "end")
+        mode = self._mode_var.get()
+        resume = self._resume_var.get()
         self._run_btn.configure(state="disabled")
+        self._progress.set(0)
 
         def worker(txt: str):
             try:
-                out_root, mawb, date_str = _rename_packing_list(self._folder)
-                self._mapping = _parse_mapping(txt, mawb)
+                mappings = _parse_mappings(txt)
+                res = rename_shipment(
+                    self._folder, mappings, mode, resume=resume,
+                    progress=lambda done, total: self._async(
+                        lambda f=done / total: self._progress.set(f)),
+                )
+                out_root, renamed, errors = res.out_root, res.counts, res.errors
+                self._mapping = mappings[res.mawb]
 
                 print("\n▶ Invoice-letter ↔ Entry-number pairs")
                 for entry, letter in self._mapping.items():
                     print(f"  {entry}  ⇄  {letter}")
                 print(f"Total pairs parsed: {len(self._mapping)}\n")
 
-                renamed_3461 = _rename_3461_pdfs(self._folder, out_root, mawb, date_str, self._mapping)
-                renamed_7501 = _rename_7501_pdfs(self._folder, out_root, mawb, date_str, self._mapping)
-
-                print(f"✔ Renamed {renamed_3461} PDF(s) under '3461 Renamed/'")
-                print(f"✔ Renamed {renamed_7501} PDF(s) under '7501 Renamed/'")
+                if res.skipped:
+                    print(f"▶ {res.skipped} file(s) already renamed and verified – skipped")
+                for dt in DOC_TYPES.values():
+                    print(f"✔ Renamed {renamed[dt.key]} file(s) under '{dt.out_dir}/'")
+                for err in errors:
+                    print(f"✘ {err}")
 
             except Exception as exc:
                 self._async(lambda exc=exc: messagebox.showerror("Renamer", str(exc)))
@@ -212,11 +709,16 @@ class FileRenamerTab:
                 self._out_dir = out_root
                 self._async(lambda: [
                     messagebox.showinfo("Renamer",
-                        f"Packing list renamed.\n"
-                        f"Parsed {len(self._mapping)} mapping pair(s).\n"
-                        f"Renamed {renamed_3461} 3461 PDF(s).\n"
-                        f"Renamed {renamed_7501} 7501 PDF(s).\n"
-                        f"Output folder:\n{out_root}"),
+                        "Packing list renamed.\n"
+                        + (f"{res.skipped} file(s) already done – skipped.\n"
+                           if res.skipped else "")
+                        + f"Parsed {len(self._mapping)} mapping pair(s).\n"
+                        + "".join(f"Renamed {n} {key} file(s).\n"
+                                  for key, n in renamed.items())
+                        + (f"{len(errors)} file(s) FAILED:\n"
+                           + "".join(f"  {err}\n" for err in errors[:10])
+                           if errors else "")
+                        + f"Output folder:\n{out_root}"),
                     self._open_btn.configure(state="normal"),
                 ])
             finally:
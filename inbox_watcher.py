@@ -0,0 +1,291 @@
+"""
+inbox_watcher.py  –  headless watch-folder service
+---------------------------------------------------
+• Pure CLI – no GUI; watches one inbox folder
+• New  *.pdf  → reject_code_sorter.read_pdf_to_txt  (→ generated_txts/)
+• New  *.xlsx → excel_splitter prepare + save_chunks (→ splitted_excels/)
+• inotify on Linux, a stat-polling scan everywhere else
+• Debounce: a file is queued only after its size + mtime stay unchanged
+  for --settle seconds, so half-copied files are left alone
+• Bounded process pool; at most 2 × workers files in flight
+• Ledger <inbox>/.processed.json (by SHA-256) – restarts skip done work;
+  failures are logged there too but retried (up to RETRIES times, RETRY_S
+  apart, and again on every restart)
+
+    python inbox_watcher.py <inbox> [--workers N] [--settle 3] [--poll 2]
+    python inbox_watcher.py <inbox> --once          # drain and exit
+"""
+
+import argparse, ctypes, datetime, json, multiprocessing, os, select, signal, struct, sys, time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import excel_splitter as splitter
+import reject_code_sorter as sorter
+
+# ── settings ─────────────────────────────────────────────────
+LEDGER_NAME = ".processed.json"
+OUT_DIR     = splitter.RUN_DIR / "splitted_excels"
+SETTLE_S    = 3.0            # unchanged size+mtime for this long = fully copied
+POLL_S      = 2.0            # scan interval without inotify / re-check interval
+RETRY_S     = 60.0           # wait before re-queuing a failed file (× attempt)
+RETRIES     = 3              # attempts per file version in one run
+
+
+# ── jobs (run in worker processes) ───────────────────────────
+def _worker_init() -> None:
+    # Ctrl+C is handled by the watcher, which lets running jobs finish
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _process_pdf(path: str) -> str:
+    return sorter.read_pdf_to_txt(path)
+
+
+def _process_xlsx(path: str, out_dir: str, rows: int, enforce_floor: bool) -> str:
+    mawb, df = splitter.load_prepared(path)
+    df = splitter.compact_frame(df)
+    parts = splitter.save_chunks(df, out_dir, mawb, rows,
+                                 enforce_floor=enforce_floor, incremental=True)
+    return f"{parts} part(s) for {mawb}"
+
+
+HANDLERS = {".pdf": _process_pdf, ".xlsx": _process_xlsx}
+
+
+# ── ledger ───────────────────────────────────────────────────
+class Ledger:
+    """
+    Processed files by content hash, persisted as JSON in the inbox.
+    Failed entries are kept for the record but never count as done.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            self.entries: dict[str, dict] = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+        # name → (size, mtime_ns) of finished files: skips re-hashing on restart
+        self._sigs = {e["name"]: (e["size"], e["mtime_ns"])
+                      for e in self.entries.values() if e.get("status") == "ok"}
+
+    def known(self, name: str, sig: tuple[int, int]) -> bool:
+        return self._sigs.get(name) == sig
+
+    def __contains__(self, digest: str) -> bool:
+        return self.entries.get(digest, {}).get("status") == "ok"
+
+    def record(self, digest: str, name: str, sig: tuple[int, int],
+               result: str | None = None, error: str | None = None) -> None:
+        self.entries[digest] = {
+            "name": name, "size": sig[0], "mtime_ns": sig[1],
+            "status": "error" if error else "ok",
+            "result": error or result,
+            "at": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        if error:
+            self._sigs.pop(name, None)
+        else:
+            self._sigs[name] = sig
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.entries, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+# ── change sources ───────────────────────────────────────────
+class _Inotify:
+    """Minimal inotify(7) via ctypes – names of entries changed in one dir."""
+    IN_MODIFY, IN_CLOSE_WRITE, IN_MOVED_TO, IN_CREATE = 0x2, 0x8, 0x80, 0x100
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, path: Path):
+        libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(path), mask) < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f"inotify_add_watch failed for {path}")
+
+    def read(self, timeout: float) -> list[str]:
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return []
+        buf, names, i = os.read(self.fd, 64 * 1024), [], 0
+        while i < len(buf):
+            _, _, _, length = self._EVENT.unpack_from(buf, i)
+            i += self._EVENT.size
+            if length:
+                names.append(os.fsdecode(buf[i:i + length].rstrip(b"\0")))
+            i += length
+        return names
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _open_inotify(path: Path) -> _Inotify | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return _Inotify(path)
+    except (OSError, AttributeError):        # no inotify in this libc / kernel
+        return None
+
+
+def _wanted(name: str) -> bool:
+    # Excel lock files (~$x.xlsx) and hidden / temp files are never jobs
+    return (not name.startswith(("~$", "."))
+            and os.path.splitext(name)[1].lower() in HANDLERS)
+
+
+def _signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+# ── service loop ─────────────────────────────────────────────
+def watch(
+    inbox: str | Path,
+    *,
+    out_dir: str | Path = OUT_DIR,
+    rows: int = splitter.ROWS_PER_FILE,
+    enforce_floor: bool = False,
+    workers: int | None = None,
+    settle: float = SETTLE_S,
+    poll: float = POLL_S,
+    once: bool = False,
+) -> int:
+    """
+    Process files arriving in *inbox* until interrupted (or, with
+    *once*, until everything present has been handled).  Returns the
+    number of files processed in this run.
+    """
+    inbox   = Path(inbox)
+    ledger  = Ledger(inbox / LEDGER_NAME)
+    workers = workers or os.cpu_count() or 1
+    notify  = None if once else _open_inotify(inbox)
+    print(f"▶ Watching {inbox} ({'inotify' if notify else 'polling'}, "
+          f"{workers} worker(s))")
+
+    pending:  dict[str, tuple[tuple[int, int], float]] = {}   # name → (sig, changed)
+    handled:  dict[str, tuple[int, int]] = {}                 # name → sig queued/skipped
+    failures: dict[str, tuple[tuple[int, int], int]] = {}     # name → (sig, attempts)
+    inflight: dict[Future, tuple[str, str, tuple[int, int]]] = {}
+    done, rescan = 0, True
+
+    def _seen(name: str, now: float) -> None:
+        sig = _signature(inbox / name)
+        if sig is None or handled.get(name) == sig:
+            pending.pop(name, None)
+        elif name not in pending or pending[name][0] != sig:
+            pending[name] = (sig, now)          # new or still growing
+
+    def _submit(pool, name: str, sig: tuple[int, int]) -> None:
+        handled[name] = sig
+        if ledger.known(name, sig):
+            return
+        path   = inbox / name
+        digest = splitter._file_digest(path)
+        if digest in ledger:
+            print(f"· {name}: already processed")
+            return
+        ext  = path.suffix.lower()
+        args = (str(path),) if ext == ".pdf" else (str(path), str(out_dir), rows,
+                                                   enforce_floor)
+        inflight[pool.submit(HANDLERS[ext], *args)] = (name, digest, sig)
+        print(f"▶ {name}: queued")
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_worker_init) as pool:
+            while True:
+                now = time.monotonic()
+                if rescan or notify is None:
+                    names = [e.name for e in os.scandir(inbox) if e.is_file()]
+                    rescan = False
+                else:
+                    names = notify.read(0)
+                for name in {n for n in names if _wanted(n)} | set(pending):
+                    _seen(name, now)
+
+                ready = sorted(n for n, (_, t) in pending.items() if now - t >= settle)
+                for name in ready:
+                    if len(inflight) >= 2 * workers:
+                        break
+                    sig, _ = pending.pop(name)
+                    _submit(pool, name, sig)
+
+                if inflight:
+                    finished, _ = wait(list(inflight), timeout=0, return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        name, digest, sig = inflight.pop(fut)
+                        try:
+                            result = fut.result()
+                        except Exception as exc:
+                            ledger.record(digest, name, sig, error=str(exc))
+                            last_sig, tries = failures.get(name, (None, 0))
+                            tries = tries + 1 if last_sig == sig else 1
+                            failures[name] = (sig, tries)
+                            if once or tries >= RETRIES:
+                                print(f"✘ {name}: {exc}")
+                            else:
+                                # locked file / dropped share: try this version again later
+                                handled.pop(name, None)
+                                pending[name] = (sig, time.monotonic() + tries * RETRY_S - settle)
+                                print(f"✘ {name}: {exc} – retry {tries} of {RETRIES - 1} "
+                                      f"in {tries * RETRY_S:.0f}s")
+                        else:
+                            failures.pop(name, None)
+                            ledger.record(digest, name, sig, result=result)
+                            print(f"✔ {name} → {result}")
+                        done += 1
+
+                if once and not pending and not inflight:
+                    return done
+                if inflight and not pending:
+                    wait(list(inflight), timeout=poll, return_when=FIRST_COMPLETED)
+                elif notify is not None:
+                    # new events, or time to re-check settling files
+                    names = notify.read(poll)
+                    for name in {n for n in names if _wanted(n)}:
+                        _seen(name, time.monotonic())
+                else:
+                    time.sleep(min(poll, settle) if pending else poll)
+    except KeyboardInterrupt:
+        print("▶ Stopped")
+        return done
+    finally:
+        if notify:
+            notify.close()
+
+
+# ── CLI ──────────────────────────────────────────────────────
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("inbox")
+    ap.add_argument("--out", default=str(OUT_DIR), help="splitter output folder")
+    ap.add_argument("--rows", type=int, default=splitter.ROWS_PER_FILE)
+    ap.add_argument("--enforce-floor", action="store_true",
+                    help="enforce the $0.51 minimum line value")
+    ap.add_argument("--workers", type=int)
+    ap.add_argument("--settle", type=float, default=SETTLE_S)
+    ap.add_argument("--poll", type=float, default=POLL_S)
+    ap.add_argument("--once", action="store_true",
+                    help="process what is in the inbox, then exit")
+    args = ap.parse_args(argv)
+
+    n = watch(args.inbox, out_dir=args.out, rows=args.rows,
+              enforce_floor=args.enforce_floor, workers=args.workers,
+              settle=args.settle, poll=args.poll, once=args.once)
+    print(f"✔ Processed {n} file(s)")
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()        # process pool in a frozen build
+    main()
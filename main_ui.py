@@ -1,5 +1,5 @@
 # main_ui.py
-import os, sys, threading
+import os, sys, threading, multiprocessing
 from pathlib import Path
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
@@ -82,6 +82,13 @@ class ExcelSplitterTab:
             variable=self.adjust_var
         ).pack(pady=(0, 10))
 
+        self.memory_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            parent,
+            text="Report peak memory (slower)",
+            variable=self.memory_var
+        ).pack(pady=(0, 10))
+
         # ── run / open buttons ─────────────────────────────────
         btns = ctk.CTkFrame(parent, fg_color="transparent")
         btns.pack(pady=10)
@@ -127,20 +134,25 @@ class ExcelSplitterTab:
 
         self.run_btn.configure(state="disabled")
         threading.Thread(target=self._worker,
-                         args=(self.file_path, rows),
+                         args=(self.file_path, rows, self.memory_var.get()),
                          daemon=True).start()
 
-    def _worker(self, src_path, rows):
+    def _worker(self, src_path, rows, trace_memory=False):
         try:
-            mawb  = splitter.get_mawb(src_path)
-            df    = splitter.prepare_dataframe(src_path)
+            mem = {} if trace_memory else None
+            mawb, df = splitter.load_prepared(src_path)   # cached per file hash
+            df    = splitter.compact_frame(df)            # categoricals, no blank cols
             parts = splitter.save_chunks(
                 df, OUT_DIR, mawb, rows,
-                enforce_floor=self.adjust_var.get()   # ← pass checkbox state
+                enforce_floor=self.adjust_var.get(),  # ← pass checkbox state
+                parallel=not trace_memory,            # tracing covers this process only
+                incremental=True,                     # skip unchanged parts
+                memory_stats=mem,                     # peak of the split, if asked
             )
             messagebox.showinfo(
                 "Done",
                 f"{parts} file(s) saved to:\n{OUT_DIR}"
+                + (f"\nPeak memory: {mem['peak_bytes'] / 2**20:.1f} MiB" if mem else "")
             )
         except Exception as exc:
             messagebox.showerror("Error", str(exc))
@@ -213,5 +225,6 @@ class MainApp(TkinterDnD.Tk):
 
 # ───────────────────────── entrypoint ─────────────────────────
 if __name__ == "__main__":
+    multiprocessing.freeze_support()      # splitter / reject process pools in the .exe
     OUT_DIR.mkdir(exist_ok=True)
     MainApp().mainloop()
@@ -0,0 +1,480 @@
+"""
+reject_bench.py  –  timing harness for reject_code_sorter
+---------------------------------------------------------
+• Pure CLI – no GUI
+• `parser` : legacy three-get_text / three-regex page loop vs. the
+             single-extraction _page_records() parser, on a real report
+• `extract`: sequential vs. process-pool page extraction
+• `cache`  : PyMuPDF extraction vs. a warm page-record cache hit
+• `region` : whole-page vs. Line#/ID-column extraction (time; records
+             must match)
+• `listing`: extract-every-page vs. lazy early-stop listing read
+• `generate`: synthetic reject report ('Line# N ID' entries, orphan
+             IDs, optional taller page-1 header, trailing summary pages)
+• `suite`  : generate small / medium / large reports, check listing
+             (whole-page and region mode), grouping and 995/465/628
+             order against the expected (and optionally stored golden)
+             output, record pages/second as JSON lines; exits 1 on any
+             mismatch
+
+    python reject_bench.py parser  <reject_report.pdf> [--repeat N]
+    python reject_bench.py extract <reject_report.pdf> [--repeat N]
+    python reject_bench.py cache   <reject_report.pdf> [--repeat N]
+    python reject_bench.py region  <reject_report.pdf> [--repeat N]
+    python reject_bench.py listing <reject_report.pdf> [--repeat N]
+    python reject_bench.py generate out.pdf --pages 200 [--orphan-every 3]
+    python reject_bench.py suite   --out reject_bench.jsonl [--golden DIR]
+"""
+
+import argparse, json, platform, random, re, sys, tempfile, time
+from pathlib import Path
+
+import fitz                              # PyMuPDF
+
+import reject_code_sorter as sorter
+
+
+# ───────────────── helpers ────────────────────────────────────
+def _best_of(fn, repeat: int) -> float:
+    """Best wall time (seconds) of *repeat* calls to *fn*."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _legacy_records(pdf_path: str) -> list[tuple[str, str]]:
+    """The pre-rewrite read_pdf_to_txt page loop, kept as reference."""
+    doc = fitz.open(pdf_path)
+    record_list, matches = [], []
+    index, diff, ln_pre = 0, 0, 1
+    for page in doc:
+        for m in re.findall(r'(Line# \d+\s+\d+)', page.get_text()):
+            matches.append(m)
+        matche1 = re.findall(r'Line# \d+\n(\d+)\n', page.get_text())
+        matche2 = re.findall(r'\n(\d+)\n', page.get_text())
+        for m in matche2:
+            if m not in matche1:
+                matches.append("Line# 0\n" + m)
+    while diff < 997:
+        if index >= len(matches):
+            break
+        ln_no = int(re.findall(r'Line# (\d+)\s+\d+', matches[index])[0])
+        diff = ln_pre - ln_no
+        record_list.append([ln_no, matches[index]])
+        ln_pre = ln_no
+        index += 1
+    if index < len(matches):
+        record_list.pop(-1)
+    doc.close()
+    return [tuple(raw.strip().split()[1:]) for _, raw in record_list]
+
+
+def _new_records(pdf_path: str) -> list[tuple[str, str]]:
+    with fitz.open(pdf_path) as doc:
+        records = []
+        for page in doc:
+            records += sorter._page_records(page.get_text())
+    return sorter._take_listing(records)
+
+
+# ───────────────── benchmarks ─────────────────────────────────
+def bench_parser(pdf_path: str, repeat: int = 3) -> dict:
+    """Compare legacy and single-pass parsing of *pdf_path*."""
+    legacy_recs, new_recs = _legacy_records(pdf_path), _new_records(pdf_path)
+    if legacy_recs != new_recs:
+        raise AssertionError("parsers disagree on " + pdf_path)
+
+    with fitz.open(pdf_path) as doc:
+        pages = doc.page_count
+    legacy = _best_of(lambda: _legacy_records(pdf_path), repeat)
+    single = _best_of(lambda: _new_records(pdf_path), repeat)
+    return {
+        "pages":    pages,
+        "records":  len(new_recs),
+        "legacy_s": round(legacy, 4),
+        "single_s": round(single, 4),
+        "speedup":  round(legacy / single, 2) if single else None,
+    }
+
+
+def bench_extract(pdf_path: str, repeat: int = 3) -> dict:
+    """Sequential vs. process-pool extraction of *pdf_path*."""
+    extract = lambda par: sorter._extract_records(pdf_path, par, cache=False)
+    if extract(False) != extract(True):
+        raise AssertionError("parallel extraction disagrees on " + pdf_path)
+
+    with fitz.open(pdf_path) as doc:
+        pages = doc.page_count
+    seq = _best_of(lambda: extract(False), repeat)
+    par = _best_of(lambda: extract(True), repeat)
+    return {
+        "pages":        pages,
+        "sequential_s": round(seq, 4),
+        "parallel_s":   round(par, 4),
+        "speedup":      round(seq / par, 2) if par else None,
+    }
+
+
+def bench_cache(pdf_path: str, repeat: int = 3) -> dict:
+    """Cold (PyMuPDF) vs. warm (record cache) extraction of *pdf_path*."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cold = _best_of(lambda: sorter._extract_records(pdf_path, cache=False), repeat)
+        first = sorter._extract_records(pdf_path, cache_dir=tmp)
+        warm = _best_of(lambda: sorter._extract_records(pdf_path, cache_dir=tmp), repeat)
+        if first != sorter._extract_records(pdf_path, cache=False):
+            raise AssertionError("cached records disagree on " + pdf_path)
+    return {
+        "records": len(first),
+        "cold_s":  round(cold, 4),
+        "warm_s":  round(warm, 4),
+        "speedup": round(cold / warm, 2) if warm else None,
+    }
+
+
+def bench_region(pdf_path: str, repeat: int = 3) -> dict:
+    """Whole-page vs. column-clipped extraction of *pdf_path*."""
+    extract = lambda region: sorter._extract_records(pdf_path, region=region,
+                                                     cache=False)
+    full, clipped = sorter._take_listing(extract(False)), sorter._take_listing(extract(True))
+    if full != clipped:
+        raise AssertionError(f"region listing disagrees on {pdf_path}: "
+                             f"{len(clipped)} records, whole page {len(full)}")
+    full_s   = _best_of(lambda: extract(False), repeat)
+    region_s = _best_of(lambda: extract(True), repeat)
+    return {
+        "clip":            sorter._learn_clip(pdf_path),
+        "full_records":    len(full),
+        "region_records":  len(clipped),
+        "full_s":          round(full_s, 4),
+        "region_s":        round(region_s, 4),
+        "speedup":         round(full_s / region_s, 2) if region_s else None,
+    }
+
+
+def bench_listing(pdf_path: str, repeat: int = 3) -> dict:
+    """Every page then cut-off vs. streaming with early stop."""
+    eager = lambda: sorter._take_listing(sorter._extract_records(pdf_path, cache=False))
+    lazy  = lambda: sorter.read_listing(pdf_path, cache=False)
+    records, read, pages = lazy()
+    if records != eager():
+        raise AssertionError("early-stop listing disagrees on " + pdf_path)
+    eager_s, lazy_s = _best_of(eager, repeat), _best_of(lazy, repeat)
+    return {
+        "pages":   pages,
+        "read":    read,
+        "skipped": pages - read,
+        "eager_s": round(eager_s, 4),
+        "lazy_s":  round(lazy_s, 4),
+        "speedup": round(eager_s / lazy_s, 2) if lazy_s else None,
+    }
+
+
+# ───────────────── synthetic reports ──────────────────────────
+# Page layout of the CBP reject report as PyMuPDF extracts it:
+# 'Line# <n>' at x=40, the message-ID below it at x=120, message text at
+# x=170.  An orphan is a bare ID line followed by continuation text.
+REPORT_IDS  = tuple(sorter.SIDE_NOTE) + ("111", "904")
+ROW_H       = 11
+ROWS_MAX    = 68                        # rows that fit below the page header
+
+LIST_TOP    = 54                        # y of the first entry below the page header
+
+# name → (listing pages, entries per page, orphan every n-th page (0 = none),
+#         trailing summary pages, y of page 1's first entry)
+SUITE_CASES = {
+    "small":  (5,   40, 2, 2, 200),
+    "medium": (50,  40, 3, 3, 200),
+    "large":  (500, 60, 0, 5, LIST_TOP),
+}
+
+
+def _expected_listing(pages: list[list[tuple[str, str]]]) -> list[tuple[str, str]]:
+    """The report rules applied to the generator's own page model."""
+    flat = [rec for page in pages for rec in page]
+    kept, prev = [], 1
+    for i, (ln, mid) in enumerate(flat):
+        kept.append((ln, mid))
+        if prev - int(ln) >= sorter.LISTING_BREAK:
+            if i + 1 < len(flat):         # the break record itself is dropped
+                kept.pop()
+            break
+        prev = int(ln)
+    return kept
+
+
+def _expected_txt(listing: list[tuple[str, str]]) -> str:
+    """Golden .txt for *listing* (default rules): first-seen IDs, then 995, 465, 628."""
+    first = list(dict.fromkeys(mid for _, mid in listing))
+    order = [m for m in first if m not in ("995", "465", "628")]
+    order += [m for m in ("995", "465", "628") if m in first]
+    out = []
+    for mid in order:
+        out.append(f"\n{mid} {sorter.SIDE_NOTE.get(mid, '')}".rstrip() + "\n")
+        out += [f"Line# {ln}\n" for ln, m in listing if m == mid]
+    return "".join(out)
+
+
+def _write_page(doc, spans: list[tuple[float, float, float, str]]) -> None:
+    """
+    New page showing (x, y, size, text) spans as separate text objects.
+
+    Writes the content stream directly – same extraction as one
+    insert_text() per span, at a fraction of the cost on large reports.
+    """
+    page = doc.new_page()
+    page.insert_font(fontname="helv")
+    h    = page.rect.height
+    ops  = [f"BT /helv {size} Tf {x} {h - y:.1f} Td ({text}) Tj ET"
+            for x, y, size, text in spans]
+    xref = doc.get_new_xref()
+    doc.update_object(xref, "<<>>")
+    doc.update_stream(xref, "\n".join(ops).encode("latin-1"))
+    page.set_contents(xref)
+
+
+def make_reject_report(path: str | Path, pages: int, *, per_page: int = 40,
+                       orphan_every: int = 3, tail_pages: int = 2,
+                       first_top: float = LIST_TOP,
+                       seed: int = 0) -> list[tuple[str, str]]:
+    """
+    Write a synthetic reject report and return its expected listing.
+
+    *pages* pages of 'Line# n ID' entries (line# rising by 1–2), an
+    orphan ID on every *orphan_every*-th page and *tail_pages* pages of
+    trailing summary whose line# restarts at 1 – the drop that ends the
+    listing once the last line# is ≥ LISTING_BREAK.  Page 1's entries
+    start at *first_top*, below a taller header block when that is
+    greater than LIST_TOP; *per_page* is capped so they still fit.
+    """
+    rnd    = random.Random(seed)
+    doc    = fitz.open()
+    model  = []                            # parsed records per page
+    extra  = max(0, int((first_top - LIST_TOP) // ROW_H))
+    per_page = min(per_page, ROWS_MAX - 2 - extra)
+    ln = 0
+
+    def _entries(spans, lines: list[int], top: float = LIST_TOP) -> list[tuple[str, str]]:
+        recs, y = [], top
+        for n in lines:
+            mid = rnd.choice(REPORT_IDS)
+            spans += [(40, y, 8, f"Line# {n}"), (120, y, 8, mid),
+                      (170, y, 8, "ENTRY REJECTED - SEE MESSAGE")]
+            recs.append((str(n), mid))
+            y += ROW_H
+        return recs
+
+    for p in range(pages):
+        spans = [(40, 40, 9, f"CBP REJECT REPORT   Page {p + 1}")]
+        top   = first_top if p == 0 else LIST_TOP
+        for k in range(extra if p == 0 else 0):
+            spans.append((40, LIST_TOP + k * ROW_H, 8,
+                          f"FILER / SUBMITTER DETAILS   LINE {k + 1} OF {extra}"))
+        lines = []
+        for _ in range(per_page):
+            ln += rnd.choice((1, 1, 1, 2))
+            lines.append(ln)
+        recs = _entries(spans, lines, top)
+        if orphan_every and p % orphan_every == 0:
+            # usually an ID not listed on this page, so it becomes a line# 0
+            listed = {m for _, m in recs}
+            mid = rnd.choice([m for m in REPORT_IDS if m not in listed] or REPORT_IDS)
+            y   = top + per_page * ROW_H
+            spans += [(120, y, 8, mid),
+                      (170, y + ROW_H, 8, "CONTINUED FROM PREVIOUS PAGE")]
+            if mid not in listed:
+                recs.append(("0", mid))
+        _write_page(doc, spans)
+        model.append(recs)
+
+    restart = 0
+    for p in range(tail_pages):
+        spans = [(40, 40, 9, f"SUMMARY OF REJECTED ENTRIES   Page {p + 1}")]
+        model.append(_entries(spans, list(range(restart + 1, restart + per_page + 1))))
+        _write_page(doc, spans)
+        restart += per_page
+
+    doc.save(str(path))
+    doc.close()
+    return _expected_listing(model)
+
+
+def check_report(path: str | Path, expected: list[tuple[str, str]],
+                 golden: str | Path | None = None, *,
+                 update_golden: bool = False) -> list[str]:
+    """
+    Problems found when sorting *path* (empty list = all good).
+
+    Checks the parsed listing against the generator's model, region
+    mode against whole-page mode, the .txt against the rendered golden
+    layout (IDs grouped, 995 → 465 → 628 last) and, with *golden*,
+    against a stored golden file.
+    """
+    problems = []
+    listing, _, _ = sorter.read_listing(str(path), cache=False)
+    if listing != expected:
+        problems.append(f"listing: {len(listing)} records, expected {len(expected)}")
+    region, _, _ = sorter.read_listing(str(path), region=True, cache=False)
+    if region != listing:
+        problems.append(f"region mode: {len(region)} records, whole page {len(listing)}")
+
+    groups = sorter.group_records(listing, sorter.DEFAULT_RULES)   # not the user's file
+    ids    = [g.mid for g in groups]
+    tail   = [m for m in ("995", "465", "628") if m in ids]
+    if ids[len(ids) - len(tail):] != tail:
+        problems.append(f"groups end with {ids[-3:]}, expected {tail}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = sorter.write_groups(groups, str(Path(tmp) / "out.txt"))
+        text = Path(out).read_text(encoding="utf-8")
+    if text != _expected_txt(expected):
+        problems.append("txt layout differs from the expected grouping")
+
+    if golden:
+        golden = Path(golden)
+        if update_golden or not golden.exists():
+            golden.parent.mkdir(parents=True, exist_ok=True)
+            golden.write_text(text, encoding="utf-8")
+        elif golden.read_text(encoding="utf-8") != text:
+            problems.append(f"differs from golden {golden.name}")
+    return problems
+
+
+def run_suite(out: str | Path, cases=tuple(SUITE_CASES), *,
+              workdir: str | Path | None = None, golden_dir: str | Path | None = None,
+              update_golden: bool = False, seed: int = 0) -> list[dict]:
+    """
+    Generate (or reuse) each case, check it and time extraction.
+
+    Throughput is pages/second for every page (_extract_records) and
+    for the early-stop listing read; one JSON line per case is appended
+    to *out*.
+    """
+    workdir = Path(workdir or Path(tempfile.gettempdir()) / "reject_bench")
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    for name in cases:
+        pages, per_page, orphan_every, tail, first_top = SUITE_CASES[name]
+        src = workdir / f"reject_{name}_s{seed}.pdf"
+        expected = make_reject_report(src, pages, per_page=per_page,
+                                      orphan_every=orphan_every, tail_pages=tail,
+                                      first_top=first_top, seed=seed)
+        golden = Path(golden_dir) / f"{name}_s{seed}.txt" if golden_dir else None
+        problems = check_report(src, expected, golden, update_golden=update_golden)
+
+        total   = pages + tail
+        full_s  = _best_of(lambda: sorter._extract_records(str(src), cache=False), 1)
+        _, read, _ = sorter.read_listing(str(src), cache=False)
+        list_s  = _best_of(lambda: sorter.read_listing(str(src), cache=False), 1)
+        res = {
+            "case":        name,
+            "pages":       total,
+            "records":     len(expected),
+            "pages_read":  read,
+            "extract_pps": round(total / full_s, 1),
+            "listing_pps": round(read / list_s, 1),
+            "ok":          not problems,
+            "problems":    problems,
+            "python":      platform.python_version(),
+            "pymupdf":     fitz.VersionBind,
+        }
+        results.append(res)
+        with open(out, "a", encoding="utf-8") as f:
+            f.write(json.dumps(res) + "\n")
+        print(f"{'✔' if res['ok'] else '✘'} {name:>6} {total:>4} pages | "
+              f"{res['extract_pps']:.0f} pages/s all | "
+              f"{res['listing_pps']:.0f} pages/s listing ({read} read)"
+              + "".join(f"\n    – {p}" for p in problems))
+    return results
+
+
+# ───────────────── CLI ────────────────────────────────────────
+def main(argv=None) -> None:
+    ap  = argparse.ArgumentParser(description=__doc__,
+                                  formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    ps = sub.add_parser("parser", help="legacy vs single-pass parser")
+    ps.add_argument("path")
+    ps.add_argument("--repeat", type=int, default=3)
+
+    ex = sub.add_parser("extract", help="sequential vs process-pool extraction")
+    ex.add_argument("path")
+    ex.add_argument("--repeat", type=int, default=3)
+
+    ca = sub.add_parser("cache", help="cold extraction vs record-cache hit")
+    ca.add_argument("path")
+    ca.add_argument("--repeat", type=int, default=3)
+
+    rg = sub.add_parser("region", help="whole-page vs column-clipped extraction")
+    rg.add_argument("path")
+    rg.add_argument("--repeat", type=int, default=3)
+
+    li = sub.add_parser("listing", help="eager vs early-stop listing read")
+    li.add_argument("path")
+    li.add_argument("--repeat", type=int, default=3)
+
+    gn = sub.add_parser("generate", help="write a synthetic reject report")
+    gn.add_argument("path")
+    gn.add_argument("--pages", type=int, default=50)
+    gn.add_argument("--per-page", type=int, default=40)
+    gn.add_argument("--orphan-every", type=int, default=3)
+    gn.add_argument("--tail", type=int, default=2)
+    gn.add_argument("--first-top", type=float, default=LIST_TOP,
+                    help="y of page 1's first entry (taller header when > %(default)s)")
+    gn.add_argument("--seed", type=int, default=0)
+
+    st = sub.add_parser("suite", help="correctness + pages/s over synthetic reports")
+    st.add_argument("--out", default="reject_bench.jsonl")
+    st.add_argument("--cases", nargs="+", choices=list(SUITE_CASES),
+                    default=list(SUITE_CASES))
+    st.add_argument("--workdir")
+    st.add_argument("--golden", help="folder of golden .txt outputs")
+    st.add_argument("--update-golden", action="store_true")
+    st.add_argument("--seed", type=int, default=0)
+
+    args = ap.parse_args(argv)
+    if args.cmd == "parser":
+        res = bench_parser(args.path, args.repeat)
+        print(f"{res['pages']} pages, {res['records']} records | "
+              f"legacy {res['legacy_s']:.3f}s | single-pass "
+              f"{res['single_s']:.3f}s | ×{res['speedup']}")
+    elif args.cmd == "extract":
+        res = bench_extract(args.path, args.repeat)
+        print(f"{res['pages']} pages | sequential {res['sequential_s']:.3f}s | "
+              f"parallel {res['parallel_s']:.3f}s | ×{res['speedup']}")
+    elif args.cmd == "cache":
+        res = bench_cache(args.path, args.repeat)
+        print(f"{res['records']} records | cold {res['cold_s']:.3f}s | "
+              f"warm {res['warm_s']:.4f}s | ×{res['speedup']}")
+    elif args.cmd == "region":
+        res = bench_region(args.path, args.repeat)
+        print(f"clip {res['clip']}\n"
+              f"full {res['full_records']} records {res['full_s']:.3f}s | "
+              f"region {res['region_records']} records {res['region_s']:.3f}s | "
+              f"×{res['speedup']}")
+    elif args.cmd == "listing":
+        res = bench_listing(args.path, args.repeat)
+        print(f"read {res['read']} of {res['pages']} pages "
+              f"(skipped {res['skipped']}) | eager {res['eager_s']:.3f}s | "
+              f"early-stop {res['lazy_s']:.3f}s | ×{res['speedup']}")
+    elif args.cmd == "generate":
+        listing = make_reject_report(args.path, args.pages, per_page=args.per_page,
+                                     orphan_every=args.orphan_every,
+                                     tail_pages=args.tail, first_top=args.first_top,
+                                     seed=args.seed)
+        print(f"✔ {args.path}: {args.pages + args.tail} pages, "
+              f"{len(listing)} listing records")
+    elif args.cmd == "suite":
+        res = run_suite(args.out, args.cases, workdir=args.workdir,
+                        golden_dir=args.golden, update_golden=args.update_golden,
+                        seed=args.seed)
+        if not all(r["ok"] for r in res):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,19 +6,39 @@ reject_code_sorter.py  –  PDF “Reject Code” extractor  (v2)
 • Creates /generated_txts/<pdf>.txt with:
       – side-notes on every ID
       – 465 placed just above 628, 628 last
+• Batch mode: many PDFs / a folder → one .txt each, plus
+      reject_summary.txt with message-ID counts across all reports
+• Parsed page records are cached per PDF hash + page under
+      cache/reject/, so re-sorting a known report skips PyMuPDF
+• Optional region mode: only the 'Line#' / message-ID columns (learned
+      from the first listing page's words) are extracted
+• Pages stream lazily into the listing cut-off – trailing pages after
+      the listing are never opened
+• sort_rejects() returns the ordered groups in memory; write_groups()
+      writes them as .txt (original layout), .json or .csv
+• Side-notes and sort ranks can be overridden in reject_rules.json
+      (hot-reloaded on change)
 • GUI tab class: RejectCodeSorterTab (dark style, same colors as before)
 """
 
-import os, re, sys, threading
+import os, re, sys, threading, hashlib, pickle, json, csv
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import closing
+from typing import NamedTuple
 import fitz                              # PyMuPDF
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 from tkinterdnd2 import DND_FILES
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 # ── paths ────────────────────────────────────────────────────
 APP_DIR     = os.path.dirname(sys.executable if getattr(sys, "frozen", False) else __file__)
 TXT_OUT_DIR = os.path.join(APP_DIR, "generated_txts")
+SUMMARY_NAME = "reject_summary.txt"
+CACHE_DIR   = os.path.join(APP_DIR, "cache", "reject")
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+PARSER_VERSION  = 3          # bump when _page_records / _row_records output changes
 os.makedirs(TXT_OUT_DIR, exist_ok=True)
 
 # ── side-notes per message-ID ───────────────────────────────
@@ -39,78 +59,644 @@ SIDE_NOTE = {
     "322": "remove - sign in the BOL"
 }
 
+# sort rank per message-ID – groups sort by (rank, first seen); unlisted = 0
+SIDE_NOTE_RANK = {"995": 1, "465": 2, "628": 3}
+
+
+# ── side-note rules file ─────────────────────────────────────
+# reject_rules.json next to the app overrides the defaults above:
+#   {"rules": {"<id>": {"note": "...", "rank": <int>}, ...}}
+# It is re-read whenever its mtime changes, so long-running batches and
+# the inbox watcher pick up edits without a restart.
+RULES_PATH = os.path.join(APP_DIR, "reject_rules.json")
+
+
+class SideNoteRules(NamedTuple):
+    notes: dict[str, str]        # message-ID → side-note
+    ranks: dict[str, int]        # message-ID → sort rank (missing = 0)
+
+
+DEFAULT_RULES = SideNoteRules(dict(SIDE_NOTE), dict(SIDE_NOTE_RANK))
+_RULES_CACHE: dict[str, tuple[int, SideNoteRules]] = {}
+
+
+def _compile_rules(data: dict) -> SideNoteRules:
+    notes, ranks = {}, {}
+    for mid, rule in data["rules"].items():
+        mid = str(mid).strip()
+        if not mid.isdigit():
+            raise ValueError(f"message-ID '{mid}' is not a number")
+        if rule.get("note"):
+            notes[mid] = str(rule["note"])
+        if rule.get("rank"):
+            ranks[mid] = int(rule["rank"])
+    return SideNoteRules(notes, ranks)
+
+
+def load_rules(path: str | None = None) -> SideNoteRules:
+    """
+    Compiled side-note rules from *path* (default `RULES_PATH`).
+
+    Cached per path and reloaded when the file's mtime changes.  No file
+    means DEFAULT_RULES; a broken file keeps the last good rules (or
+    raises ValueError if there are none yet).
+    """
+    path = os.path.abspath(path or RULES_PATH)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return DEFAULT_RULES
+    hit = _RULES_CACHE.get(path)
+    if hit and hit[0] == mtime:
+        return hit[1]
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            rules = _compile_rules(json.load(f))
+    except (ValueError, KeyError, TypeError, AttributeError) as exc:
+        if hit:
+            print(f"✘ {os.path.basename(path)} is invalid ({exc}) – keeping previous rules")
+            return hit[1]
+        raise ValueError(f"Invalid rules file {path}: {exc}") from exc
+    _RULES_CACHE[path] = (mtime, rules)
+    return rules
+
 # ── core logic ───────────────────────────────────────────────
-def read_pdf_to_txt(pdf_path: str) -> str:
-    """Parse *pdf_path* and write an ordered .txt with side-notes."""
-    doc = fitz.open(pdf_path)
-    record_list = []
-    matches = []
-    # collect consecutive 'Line#' blocks
-    for page in doc:
-        matche = re.findall(r'(Line# \d+\s+\d+)', page.get_text())
-        index = 0
-        diff = 0
-        ln_pre = 1
-        for m in matche:
-            matches.append(m)
-        matche1 = re.findall(r'Line# \d+\n(\d+)\n', page.get_text())
-        matche2 = re.findall(r'\n(\d+)\n', page.get_text())
-        for m in matche2:
-            if m not in matche1:
-                matches.append("Line# 0\n" + m)
-    while diff<997:
-        if index >= len(matches):
-            break  # Avoid index out of range
-        ln_no = int(re.findall(r'Line# (\d+)\s+\d+', matches[index])[0])
-        diff = ln_pre-ln_no
-        record_list.append([ln_no, matches[index]])
+# One scan per page.  Alternative 1 is a 'Line# <n> <id>' entry;
+# alternative 2 is a bare number on its own line (an orphan ID).  The
+# orphan branch only looks ahead at its closing newline so the scan can
+# reproduce the old findall(r'\n(\d+)\n') pairing exactly (see below).
+_TOKEN_RE = re.compile(r"Line# (\d+)(\s+)(\d+)|\n(\d+)(?=\n)")
+LISTING_BREAK = 997          # line# drop that marks the end of the listing
+PARALLEL_MIN_PAGES = 64      # below this a process pool costs more than it saves
+CLIP_PAD = 2.0               # pt of slack around the learned Line#/ID columns
+
+
+def _page_records(text: str) -> list[tuple[str, str]]:
+    """
+    (line#, message-ID) pairs for one page, in report order.
+
+    Listed entries come first, then orphan IDs as line# "0" – unless
+    the same ID sits directly under a 'Line# n' on this page.
+    """
+    records, orphans, listed = [], [], set()
+    taken = -1              # end of the last orphan match, incl. its '\n'
+
+    for m in _TOKEN_RE.finditer(text):
+        if m.group(1) is None:                          # bare number line
+            if m.start() >= taken:
+                orphans.append(m.group(4))
+                taken = m.end() + 1
+            continue
+
+        ln, ws, mid = m.group(1, 2, 3)
+        records.append((ln, mid))
+        ends_line = text.startswith("\n", m.end())
+        if ws == "\n" and ends_line:
+            listed.add(mid)
+        # an ID on its own line also counts as a bare-number line
+        if ws.endswith("\n") and ends_line and m.start(3) - 1 >= taken:
+            orphans.append(mid)
+            taken = m.end() + 1
+
+    records += [("0", mid) for mid in orphans if mid not in listed]
+    return records
+
+
+def _row_records(words: list[tuple]) -> list[tuple[str, str]]:
+    """
+    (line#, message-ID) pairs for one page from its clipped words.
+
+    Region-mode counterpart of _page_records.  Words are grouped into
+    rows by their vertical centre.  A row with 'Line# <n> <ID>' is a
+    listed entry; a row holding one bare number is an orphan ID, kept
+    as line# "0" unless the ID is listed on this page.  Rows are matched
+    by position, so an orphan directly under the last entry is not lost
+    to the missing message text in between.
+    """
+    rows: list[tuple[float, list[tuple]]] = []
+    for w in sorted(words, key=lambda w: (w[1] + w[3], w[0])):
+        mid_y = (w[1] + w[3]) / 2
+        if rows and mid_y - rows[-1][0] <= (w[3] - w[1]) / 2:
+            rows[-1][1].append(w)
+        else:
+            rows.append((mid_y, [w]))
+
+    records, orphans = [], []
+    for _, row in rows:
+        texts = [w[4] for w in sorted(row, key=lambda w: w[0])]
+        if "Line#" in texts:
+            for i in range(len(texts) - 2):
+                if (texts[i] == "Line#" and texts[i + 1].isdecimal()
+                        and texts[i + 2].isdecimal()):
+                    records.append((texts[i + 1], texts[i + 2]))
+        elif len(texts) == 1 and texts[0].isdecimal():
+            orphans.append(texts[0])
+
+    listed = {mid for _, mid in records}
+    return records + [("0", mid) for mid in orphans if mid not in listed]
+
+
+def _take_listing(records: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+    """
+    Keep records until the line# falls back by ≥ LISTING_BREAK.
+
+    Consumes *records* only up to the record after the break, so a lazy
+    page stream stops there.
+    """
+    kept, ln_pre, diff = [], 1, 0
+    for ln, mid in records:
+        if diff >= LISTING_BREAK:
+            break
+        ln_no = int(ln)
+        diff = ln_pre - ln_no
+        kept.append((ln, mid))
         ln_pre = ln_no
-        index += 1
-    if index < len(matches):
-        record_list.pop(-1)
-
-    # preserve first-seen order of IDs
-    ordered_ids, seen = [], set()
-    for _, raw in record_list:
-        mid = re.findall(r'Line# \d+\s+(\d+)', raw)[0]
-        if mid not in seen:
-            ordered_ids.append(mid)
-            seen.add(mid)
-
-    # move 465 just before 628, 628 last
-    ordered_ids = [i for i in ordered_ids if i not in ("465", "628", "995")]
-    if "995" in seen:
-        ordered_ids.append("995")
-    if "465" in seen:
-        ordered_ids.append("465")
-    if "628" in seen:
-        ordered_ids.append("628")
-
-    # group line numbers by ID
+    else:
+        return kept              # ran out of records: keep the last one
+    kept.pop(-1)                 # drop the record that broke the run
+    return kept
+
+
+# ── page-record cache ────────────────────────────────────────
+# One pickle per PDF content hash: {"pages": n, "records": {page: [...]}}.
+# Entries are keyed per page so a partly parsed report can be topped up.
+def _file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(1 << 20):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _cache_entry(digest: str, cache_dir: str, region: bool = False) -> str:
+    mode = "-region" if region else ""
+    return os.path.join(cache_dir, f"{digest}-v{PARSER_VERSION}{mode}.pkl")
+
+
+def _load_cached(entry: str) -> dict | None:
+    try:
+        with open(entry, "rb") as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:                     # truncated / foreign pickle
+        _remove(entry)
+        return None
+    try:
+        os.utime(entry)                   # refresh LRU position
+    except FileNotFoundError:             # evicted by another worker meanwhile
+        pass
+    return cached
+
+
+def _store_cached(entry: str, cached: dict, max_bytes: int) -> None:
+    cache_dir = os.path.dirname(entry)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{entry}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(cached, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, entry)
+    _evict(cache_dir, max_bytes)
+
+
+def _remove(path: str) -> None:
+    """os.remove that lets another batch_sort worker get there first."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _evict(cache_dir: str, max_bytes: int) -> None:
+    """
+    Drop least-recently-used entries until the cache fits *max_bytes*.
+
+    batch_sort workers share the cache, so entries another worker has
+    already evicted are skipped rather than treated as errors.
+    """
+    entries = []
+    for e in os.scandir(cache_dir):
+        if not e.name.endswith(".pkl"):
+            continue
+        try:
+            st = e.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime, st.st_size, e.path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        _remove(path)
+        total -= size
+
+
+def clear_record_cache(cache_dir: str | None = None) -> None:
+    cache_dir = cache_dir or CACHE_DIR
+    if os.path.isdir(cache_dir):
+        for e in os.scandir(cache_dir):
+            if e.name.endswith(".pkl"):
+                _remove(e.path)
+
+
+# ── extraction ───────────────────────────────────────────────
+def _learn_clip(pdf_path: str) -> tuple[float, float] | None:
+    """
+    ``(x0, x1)`` of the 'Line# <n>' and message-ID columns.
+
+    Taken from the words of the first page that has a listing and
+    widened by CLIP_PAD.  Only the columns are learned: page 1 carries a
+    taller header than the continuation pages, so each page is clipped
+    over its full height (_parse_page).  None if no page has a 'Line#'
+    entry (the caller then extracts whole pages).
+    """
+    with fitz.open(pdf_path) as doc:
+        for page in doc:
+            words = page.get_text("words")
+            band  = fitz.Rect()
+            for i, w in enumerate(words[:-2]):
+                # ('Line#', <line#>, <ID>) in reading order
+                if w[4] == "Line#" and words[i + 2][4].isdigit():
+                    band |= fitz.Rect(w[:4])
+                    band |= fitz.Rect(words[i + 2][:4])
+            if not band.is_empty:
+                return (band.x0 - CLIP_PAD, band.x1 + CLIP_PAD)
+    return None
+
+
+def _parse_page(page, clip: tuple[float, float] | None) -> list[tuple[str, str]]:
+    """Records of one page: whole-page text, or the clipped words in region mode."""
+    if clip is None:
+        return _page_records(page.get_text())
+    x0, x1 = clip
+    rect   = page.rect
+    return _row_records(page.get_text("words", clip=(x0, rect.y0, x1, rect.y1)))
+
+
+def _extract_pages(pdf_path: str, pages: list[int],
+                   clip: tuple[float, float] | None = None) -> list[list[tuple[str, str]]]:
+    """Records per page for *pages* – runs in a worker with its own handle."""
+    with fitz.open(pdf_path) as doc:
+        return [_parse_page(doc[i], clip) for i in pages]
+
+
+def _iter_parsed(pdf_path: str, pages: range, parallel: bool,
+                 clip: tuple[float, float] | None) -> Iterator[tuple[int, list]]:
+    """
+    Lazily yield (page, records) for *pages* in page order.
+
+    Sequentially one page at a time; with *parallel*, in waves of one
+    slice per worker, so a consumer that stops early leaves at most one
+    wave of pages parsed ahead of it.
+    """
+    workers = min(os.cpu_count() or 1, len(pages))
+    if not parallel or workers < 2 or len(pages) < PARALLEL_MIN_PAGES:
+        with fitz.open(pdf_path) as doc:
+            for i in pages:
+                yield i, _parse_page(doc[i], clip)
+        return
+
+    # a few slices per worker evens out pages of uneven density
+    step   = -(-len(pages) // (workers * 4))
+    slices = [pages[i:i + step] for i in range(0, len(pages), step)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for w in range(0, len(slices), workers):
+            wave = slices[w:w + workers]
+            futs = [pool.submit(_extract_pages, pdf_path, list(s), clip) for s in wave]
+            for s, fut in zip(wave, futs):
+                yield from zip(s, fut.result())
+
+
+def _page_stream(pdf_path: str, cached: dict, parallel: bool,
+                 region: bool) -> Iterator[list[tuple[str, str]]]:
+    """
+    Records of each page in order, filling *cached* as pages are parsed.
+
+    Pages already in the cache are served without touching PyMuPDF;
+    runs of missing pages are parsed on demand.
+    """
+    n, by_page = cached["pages"], cached["records"]
+    clip, learned = None, not region
+    i = 0
+    while i < n:
+        if i in by_page:
+            yield by_page[i]
+            i += 1
+            continue
+        if not learned:
+            clip, learned = _learn_clip(pdf_path), True
+        j = i
+        while j < n and j not in by_page:
+            j += 1
+        with closing(_iter_parsed(pdf_path, range(i, j), parallel, clip)) as parsed:
+            for page, recs in parsed:
+                by_page[page] = recs
+                yield recs
+        i = j
+
+
+def _open_cached(pdf_path: str, region: bool, cache: bool,
+                 cache_dir: str | None) -> tuple[str | None, dict]:
+    """(cache entry or None, {"pages": n, "records": {page: [...]}})."""
+    entry  = (_cache_entry(_file_digest(pdf_path), cache_dir or CACHE_DIR, region)
+              if cache else None)
+    cached = _load_cached(entry) if entry else None
+    if cached is None:
+        with fitz.open(pdf_path) as doc:
+            cached = {"pages": doc.page_count, "records": {}}
+    return entry, cached
+
+
+def _extract_records(
+    pdf_path: str,
+    parallel: bool = False,
+    *,
+    region: bool = False,
+    cache: bool = True,
+    cache_dir: str | None = None,
+    max_bytes: int = CACHE_MAX_BYTES,
+) -> list[tuple[str, str]]:
+    """
+    All page records of *pdf_path*, in page order.
+
+    With *cache* the records are looked up by the file's SHA-256 and
+    page index first; only pages missing from the cache are parsed.
+    *region* restricts extraction to the Line#/ID columns (_learn_clip)
+    and pairs them row by row (_row_records), which drops stray numbers
+    elsewhere on the page.
+    """
+    entry, cached = _open_cached(pdf_path, region, cache, cache_dir)
+    before  = len(cached["records"])
+    records = [rec for recs in _page_stream(pdf_path, cached, parallel, region)
+               for rec in recs]
+    if entry and len(cached["records"]) > before:
+        _store_cached(entry, cached, max_bytes)
+    return records
+
+
+def read_listing(
+    pdf_path: str,
+    parallel: bool = False,
+    *,
+    region: bool = False,
+    cache: bool = True,
+    cache_dir: str | None = None,
+    max_bytes: int = CACHE_MAX_BYTES,
+) -> tuple[list[tuple[str, str]], int, int]:
+    """
+    ``(records, pages_read, page_count)`` for the listing of *pdf_path*.
+
+    Pages are streamed into _take_listing, so reading stops as soon as
+    the line# run breaks (plus the one record needed to confirm it);
+    trailing boilerplate pages are never opened.  Same records as
+    ``_take_listing(_extract_records(...))``.
+    """
+    entry, cached = _open_cached(pdf_path, region, cache, cache_dir)
+    before, read = len(cached["records"]), 0
+
+    def records() -> Iterator[tuple[str, str]]:
+        nonlocal read
+        with closing(_page_stream(pdf_path, cached, parallel, region)) as pages:
+            for recs in pages:
+                read += 1
+                yield from recs
+
+    with closing(records()) as stream:
+        listing = _take_listing(stream)
+    if entry and len(cached["records"]) > before:
+        _store_cached(entry, cached, max_bytes)
+    return listing, read, cached["pages"]
+
+
+def _ordered_ids(record_list: list[tuple[str, str]],
+                 ranks: dict[str, int] = SIDE_NOTE_RANK) -> list[str]:
+    """Message-IDs by rank, first-seen order within a rank (stable sort)."""
+    first_seen = dict.fromkeys(mid for _, mid in record_list)
+    return sorted(first_seen, key=lambda mid: ranks.get(mid, 0))
+
+
+# ── structured results ───────────────────────────────────────
+class RejectGroup(NamedTuple):
+    mid:   str                   # message-ID
+    note:  str                   # side-note text ("" if none)
+    lines: tuple[str, ...]       # line numbers in report order ("0" = orphan)
+
+
+def group_records(record_list: Iterable[tuple[str, str]],
+                  rules: SideNoteRules | None = None) -> list[RejectGroup]:
+    """Ordered groups for listing records – pure, no I/O given *rules*."""
+    rules = rules or load_rules()
+    record_list = list(record_list)
     groups = defaultdict(list)
-    for _, raw in record_list:
-        _, ln, mid = raw.strip().split()
-        groups[mid].append(f"Line# {ln}")
+    for ln, mid in record_list:
+        groups[mid].append(ln)
+    return [RejectGroup(mid, rules.notes.get(mid, ""), tuple(groups[mid]))
+            for mid in _ordered_ids(record_list, rules.ranks)]
 
-    # write file
-    out_path = os.path.join(
-        TXT_OUT_DIR, os.path.splitext(os.path.basename(pdf_path))[0] + ".txt"
-    )
-    with open(out_path, "w", encoding="utf-8") as f:
-        for mid in ordered_ids:
-            note = SIDE_NOTE.get(mid, "")
-            f.write(f"\n{mid} {note}\n".rstrip() + "\n")   # header with side-note
-            for ln in groups[mid]:
-                f.write(f"{ln}\n")
 
+def sort_rejects(pdf_path: str, *, parallel: bool = False,
+                 region: bool = False) -> list[RejectGroup]:
+    """
+    Ordered reject groups of *pdf_path*.
+
+    Writes no output file and prints nothing; pages it has to parse are
+    still stored in the page-record cache (CACHE_DIR), as on every read.
+    """
+    record_list, _, _ = read_listing(pdf_path, parallel, region=region)
+    return group_records(record_list)
+
+
+# ── writers ──────────────────────────────────────────────────
+def _write_txt(groups: list[RejectGroup], f) -> None:
+    for g in groups:
+        f.write(f"\n{g.mid} {g.note}\n".rstrip() + "\n")   # header with side-note
+        for ln in g.lines:
+            f.write(f"Line# {ln}\n")
+
+
+def _write_json(groups: list[RejectGroup], f) -> None:
+    json.dump([{"id": g.mid, "note": g.note, "lines": [int(ln) for ln in g.lines]}
+               for g in groups], f, indent=2)
+    f.write("\n")
+
+
+def _write_csv(groups: list[RejectGroup], f) -> None:
+    w = csv.writer(f, lineterminator="\n")
+    w.writerow(["message_id", "side_note", "line"])
+    for g in groups:
+        w.writerows((g.mid, g.note, ln) for ln in g.lines)
+
+
+# extension → writer(groups, text file); add entries here for new formats
+WRITERS = {"txt": _write_txt, "json": _write_json, "csv": _write_csv}
+
+
+def write_groups(groups: list[RejectGroup], out_path: str,
+                 fmt: str | None = None) -> str:
+    """Write *groups* to *out_path* as *fmt* (default: its extension)."""
+    fmt = (fmt or os.path.splitext(out_path)[1].lstrip(".")).lower()
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown output format '{fmt}' – use one of "
+                         + ", ".join(WRITERS))
+    # csv writes its own line endings; txt/json keep the platform's
+    with open(out_path, "w", encoding="utf-8",
+              newline="" if fmt == "csv" else None) as f:
+        WRITERS[fmt](groups, f)
     return out_path
 
+
+class _Report(NamedTuple):
+    path:   str                  # output written
+    counts: dict[str, int]       # line count per message-ID
+    read:   int                  # pages parsed / served from cache
+    pages:  int                  # pages in the PDF
+
+
+def _sort_report(pdf_path: str, parallel: bool = False, region: bool = False,
+                 fmt: str = "txt", out_path: str | None = None) -> _Report:
+    """Write the output for *pdf_path* – runs in batch workers, prints nothing."""
+    record_list, read, pages = read_listing(pdf_path, parallel, region=region)
+    groups   = group_records(record_list)
+    out_path = out_path or os.path.join(
+        TXT_OUT_DIR, os.path.splitext(os.path.basename(pdf_path))[0] + "." + fmt
+    )
+    write_groups(groups, out_path, fmt)
+    return _Report(out_path, {g.mid: len(g.lines) for g in groups}, read, pages)
+
+
+def _print_pages(pdf_path: str, rep: _Report) -> None:
+    print(f"✔ {os.path.basename(pdf_path)}: read {rep.read} of {rep.pages} page(s), "
+          f"skipped {rep.pages - rep.read}")
+
+
+def read_pdf_to_txt(pdf_path: str, *, parallel: bool = False,
+                    region: bool = False, fmt: str = "txt") -> str:
+    """
+    Parse *pdf_path* and write an ordered .txt with side-notes.
+
+    parallel=True spreads page extraction over a process pool (reports
+    of PARALLEL_MIN_PAGES pages or more); the output is unchanged.
+    region=True only reads the Line#/message-ID columns.  *fmt* picks
+    another writer from WRITERS ("json", "csv").
+    """
+    rep = _sort_report(pdf_path, parallel, region, fmt)
+    _print_pages(pdf_path, rep)
+    return rep.path
+
+
+# ── batch mode ───────────────────────────────────────────────
+def collect_pdfs(paths) -> list[str]:
+    """Expand *paths* (PDFs and/or folders) to a de-duplicated PDF list."""
+    pdfs, seen = [], set()
+    for p in paths:
+        if os.path.isdir(p):
+            found = sorted(os.path.join(p, f) for f in os.listdir(p)
+                           if f.lower().endswith(".pdf"))
+        elif p.lower().endswith(".pdf"):
+            found = [p]
+        else:
+            continue
+        for f in found:
+            key = os.path.normcase(os.path.abspath(f))
+            if key not in seen:
+                seen.add(key)
+                pdfs.append(f)
+    return pdfs
+
+
+def _output_paths(pdfs: list[str], fmt: str) -> dict[str, str]:
+    """
+    Output path per PDF in TXT_OUT_DIR.  PDFs with the same name (from
+    different folders) get ' (2)', ' (3)' … in input order, and none may
+    take SUMMARY_NAME.
+    """
+    taken, out = {os.path.normcase(SUMMARY_NAME)}, {}
+    for pdf in pdfs:
+        stem = os.path.splitext(os.path.basename(pdf))[0]
+        name, n = f"{stem}.{fmt}", 1
+        while os.path.normcase(name) in taken:
+            n += 1
+            name = f"{stem} ({n}).{fmt}"
+        taken.add(os.path.normcase(name))
+        out[pdf] = os.path.join(TXT_OUT_DIR, name)
+    return out
+
+
+def _write_summary(outputs: dict[str, str], counts: Counter, reports: Counter,
+                   errors: dict[str, str]) -> str:
+    """Write SUMMARY_NAME into TXT_OUT_DIR and return its path."""
+    path  = os.path.join(TXT_OUT_DIR, SUMMARY_NAME)
+    notes = load_rules().notes
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"Reject summary – {len(outputs)} report(s)\n\n")
+        for mid, n in sorted(counts.items(), key=lambda kv: (-kv[1], int(kv[0]))):
+            note = f"  ({notes[mid]})" if mid in notes else ""
+            f.write(f"{mid:>5}  {n:>6} line(s)  in {reports[mid]} report(s){note}\n")
+        if errors:
+            f.write(f"\nFailed – {len(errors)} report(s)\n")
+            for pdf, err in errors.items():
+                f.write(f"{os.path.basename(pdf)}: {err}\n")
+    return path
+
+
+def batch_sort(paths, workers: int | None = None, *,
+               region: bool = False, fmt: str = "txt") -> tuple[list[str], str]:
+    """
+    Sort every PDF in *paths* (files and/or folders) on a process pool.
+
+    Writes one .txt (or *fmt*) per PDF plus SUMMARY_NAME into TXT_OUT_DIR
+    (same-named PDFs get numbered outputs, see _output_paths) and returns
+    (output paths in input order, summary path).  A report that fails is
+    listed in the summary instead of aborting the batch.
+    """
+    pdfs = collect_pdfs(paths)
+    if not pdfs:
+        raise ValueError("No PDF files to sort.")
+    out_paths = _output_paths(pdfs, fmt)
+
+    results: dict[str, _Report] = {}
+    errors:  dict[str, str] = {}
+    workers = min(workers or os.cpu_count() or 1, len(pdfs))
+    if workers < 2:
+        for pdf in pdfs:
+            try:
+                results[pdf] = _sort_report(pdf, region=region, fmt=fmt,
+                                            out_path=out_paths[pdf])
+            except Exception as exc:
+                errors[pdf] = str(exc)
+            else:
+                _print_pages(pdf, results[pdf])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futs = {pool.submit(_sort_report, pdf, False, region, fmt,
+                                out_paths[pdf]): pdf
+                    for pdf in pdfs}
+            for fut in as_completed(futs):
+                pdf = futs[fut]
+                try:
+                    results[pdf] = fut.result()
+                except Exception as exc:
+                    errors[pdf] = str(exc)
+                else:
+                    _print_pages(pdf, results[pdf])
+
+    outputs = {pdf: results[pdf].path for pdf in pdfs if pdf in results}
+    counts, reports = Counter(), Counter()
+    for rep in results.values():
+        counts.update(rep.counts)
+        reports.update(rep.counts.keys())
+    summary = _write_summary(outputs, counts, reports, errors)
+    print(f"✔ Sorted {len(outputs)} of {len(pdfs)} report(s) → {TXT_OUT_DIR}")
+    return list(outputs.values()), summary
+
 # ── GUI tab ──────────────────────────────────────────────────
 class RejectCodeSorterTab:
     def __init__(self, parent):
-        self.pdf_path = ""
+        self.pdf_paths: list[str] = []
 
-        ctk.CTkLabel(parent, text="Drag & Drop PDF Here or Use Browse",
+        ctk.CTkLabel(parent, text="Drag & Drop PDF(s) or a Folder Here or Use Browse",
                      font=("Arial", 14)).pack(pady=(20, 10))
 
         # drop zone (colors unchanged)
@@ -126,7 +712,19 @@ class RejectCodeSorterTab:
         self.drop_target.drop_target_register(DND_FILES)
         self.drop_target.dnd_bind("<<Drop>>", self._on_drop)
 
-        ctk.CTkButton(parent, text="Browse File", command=self._browse).pack(pady=5)
+        browse = ctk.CTkFrame(parent, fg_color="transparent")
+        browse.pack(pady=5)
+        ctk.CTkButton(browse, text="Browse File(s)",
+                      command=self._browse).pack(side="left", padx=5)
+        ctk.CTkButton(browse, text="Browse Folder",
+                      command=self._browse_folder).pack(side="left", padx=5)
+
+        self.region_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(
+            parent,
+            text="Only read the Line# / message-ID columns",
+            variable=self.region_var
+        ).pack(pady=(0, 5))
 
         btns = ctk.CTkFrame(parent, fg_color="transparent")
         btns.pack(pady=10)
@@ -137,23 +735,29 @@ class RejectCodeSorterTab:
                       command=lambda: os.startfile(TXT_OUT_DIR)).pack(side="left", padx=10)
 
     # ---------- helper callbacks ----------
-    def _set_file(self, path):
-        self.pdf_path = path
-        self.drop_info.configure(text=os.path.basename(path))
+    def _set_files(self, paths):
+        pdfs = collect_pdfs(paths)
+        if not pdfs:
+            return
+        self.pdf_paths = pdfs
+        label = (os.path.basename(pdfs[0]) if len(pdfs) == 1
+                 else f"{len(pdfs)} PDFs selected")
+        self.drop_info.configure(text=label)
         self.run_btn.configure(state="normal")
 
     def _browse(self):
-        p = filedialog.askopenfilename(filetypes=[("PDF files", "*.pdf")])
-        if p: self._set_file(p)
+        ps = filedialog.askopenfilenames(filetypes=[("PDF files", "*.pdf")])
+        if ps: self._set_files(ps)
+
+    def _browse_folder(self):
+        d = filedialog.askdirectory()
+        if d: self._set_files([d])
 
     def _on_drop(self, event):
-        for f in self.drop_target.tk.splitlist(event.data):
-            if f.lower().endswith(".pdf"):
-                self._set_file(f)
-                break
+        self._set_files(self.drop_target.tk.splitlist(event.data))
 
     def _run_clicked(self):
-        if not self.pdf_path:
+        if not self.pdf_paths:
             messagebox.showerror("No file selected", "Please pick a PDF.")
             return
         self.run_btn.configure(state="disabled")
@@ -161,8 +765,13 @@ class RejectCodeSorterTab:
 
     def _worker(self):
         try:
-            out = read_pdf_to_txt(self.pdf_path)
-            # instead of a messagebox, just open the .txt:
+            region = self.region_var.get()
+            if len(self.pdf_paths) == 1:
+                out = read_pdf_to_txt(self.pdf_paths[0], parallel=True,
+                                      region=region)
+            else:
+                _, out = batch_sort(self.pdf_paths, region=region)
+            # instead of a messagebox, just open the .txt (or the summary):
             os.startfile(out)
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -0,0 +1,61 @@
+"""
+rename_batch.py  –  multi-shipment File Renamer
+-----------------------------------------------
+• Pure CLI – same renaming as the File Renamer tab
+• <parent> holds one sub-folder per shipment (packing list + 3461/ + 7501/);
+  '<mawb> renamed' outputs are written next to them
+• <mapping> is one text file with the invoice ↔ entry pairs of every MAWB
+• Shipments run in parallel (--workers), each with its own transfer pool
+  (--io-workers); exit code 1 if any shipment or file failed
+• Each run is journaled in '<mawb> renamed/rename_journal.jsonl';
+  --resume skips outputs already verified, --dry-run only prints the plan
+
+    python rename_batch.py <parent> <mapping.txt> [--mode copy|hardlink|reflink|move]
+                           [--workers 4] [--io-workers 8] [--resume] [--dry-run]
+"""
+
+import argparse, sys
+from pathlib import Path
+
+import file_renamer as renamer
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("parent", help="folder of shipment folders")
+    ap.add_argument("mapping", help="text file with MAWB-letter / entry pairs")
+    ap.add_argument("--mode", choices=renamer.TRANSFER_MODES, default="copy")
+    ap.add_argument("--workers", type=int, default=renamer.SHIPMENT_WORKERS,
+                    help="shipments renamed at once")
+    ap.add_argument("--io-workers", type=int, default=renamer.IO_WORKERS,
+                    help="concurrent file transfers per shipment")
+    ap.add_argument("--resume", action="store_true",
+                    help="skip files a previous run completed (size + SHA-256 checked)")
+    ap.add_argument("--dry-run", action="store_true",
+                    help="print every planned transfer, change nothing")
+    args = ap.parse_args(argv)
+
+    text    = Path(args.mapping).read_text(encoding="utf-8", errors="replace")
+    results = renamer.batch_rename(args.parent, text, args.mode,
+                                   workers=args.workers, io_workers=args.io_workers,
+                                   resume=args.resume, dry_run=args.dry_run)
+
+    failed = [r for r in results if r.errors]
+    files  = sum(sum(r.counts.values()) for r in results)
+    skipped = sum(r.skipped for r in results)
+    print(f"\n✔ {len(results) - len(failed)} of {len(results)} shipment(s) clean, "
+          f"{files} form file(s) {'to rename' if args.dry_run else 'renamed'}"
+          + (f", {skipped} file(s) already done" if skipped else ""))
+    for r in failed:
+        print(f"✘ {r.mawb or r.folder.name}:")
+        for err in r.errors[:10]:
+            print(f"    {err}")
+        if len(r.errors) > 10:
+            print(f"    … {len(r.errors) - 10} more")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,545 @@
+"""
+splitter_bench.py  –  timing harness for excel_splitter
+-------------------------------------------------------
+• Pure CLI – no GUI
+• `reader`    : legacy two-pass read (get_mawb + pd.read_excel)
+                vs. the single-open read_packing_list()
+• `transform` : legacy update()/apply() transform vs. transform_raw(),
+                on the file's rows tiled up to --rows
+• `writer`    : save_chunks engine="pandas" vs. engine="xlsxwriter"
+• `memory`    : prepared vs. compact frame size, traced peak of a split
+• `streaming` : save_chunks vs. split_streaming – same cells written,
+                also on a list whose first part has digits-only HS codes
+• `generate`  : synthetic packing list (legacy / commodity layout,
+                MAWB in U9, table from row 10)
+• `run`       : per-stage timings + peak RSS for one synthetic list,
+                printed as one JSON line
+• `suite`     : `run` over a size × layout grid, each case in a fresh
+                process, appended to a JSON-lines file
+• `compare`   : flag stages that got slower between two suite files
+
+    python splitter_bench.py reader    <packing_list.xlsx> [--repeat N]
+    python splitter_bench.py transform <packing_list.xlsx> [--rows 100000]
+    python splitter_bench.py writer    <packing_list.xlsx> [--repeat N]
+    python splitter_bench.py memory    <packing_list.xlsx>
+    python splitter_bench.py streaming <packing_list.xlsx> [--rows-per-file N]
+    python splitter_bench.py generate  out.xlsx --rows 20000 --layout commodity
+    python splitter_bench.py suite     --out bench.jsonl [--sizes 1000 500000]
+    python splitter_bench.py compare   old.jsonl new.jsonl [--tolerance 1.2]
+"""
+
+import argparse, json, platform, random, re, subprocess, sys, tempfile, time
+from pathlib import Path
+
+import pandas as pd
+import xlsxwriter
+from openpyxl import load_workbook
+
+import excel_splitter as splitter
+
+
+# ───────────────── helpers ────────────────────────────────────
+def _best_of(fn, repeat: int) -> float:
+    """Best wall time (seconds) of *repeat* calls to *fn*."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _legacy_read(path: str) -> tuple[str, pd.DataFrame]:
+    mawb = splitter.get_mawb(path)
+    raw  = pd.read_excel(path, skiprows=9, engine="openpyxl")
+    return mawb, raw
+
+
+def _legacy_transform(raw: pd.DataFrame) -> pd.DataFrame:
+    """The pre-vectorisation prepare_dataframe body, kept as reference."""
+    H, idx = splitter.HEADERS, splitter.xl_idx
+    has_desc = any("commodity" in str(h).lower() for h in raw.columns)
+    mapped = {}
+    if has_desc:
+        mapped[H[idx("C")]] = raw.iloc[:, 2]
+        for src, tgt in splitter.MAPPING.items():
+            i = idx(src)
+            mapped[H[idx(tgt)]] = raw.iloc[:, i + 1 if i >= 2 else i]
+    else:
+        for src, tgt in splitter.MAPPING.items():
+            mapped[H[idx(tgt)]] = raw.iloc[:, idx(src)]
+
+    base = pd.DataFrame(mapped).dropna(how="all").reset_index(drop=True)
+    df = pd.DataFrame(index=base.index, columns=H)
+    df.update(base)
+    for tgt, val in splitter.CONSTANTS.items():
+        df[H[idx(tgt)]] = val
+
+    mid_c, cntry_c = H[idx("T")], H[idx("S")]
+    sg_mask = df[mid_c].astype(str).str.upper().str.startswith("SG", na=False)
+    hk_mask = df[mid_c].astype(str).str.upper().str.startswith("HK", na=False)
+    df.loc[sg_mask, cntry_c] = "SG"
+    df.loc[hk_mask, cntry_c] = "HK"
+
+    def _pad_zip(x):
+        if pd.isna(x):
+            return ""
+        s = str(x).strip()
+        m = re.fullmatch(r'(\d+)(?:\.0*)?', s)
+        return f"{int(m.group(1)):06d}" if m else s
+
+    for zip_col in ("Manufacturer_Zip", "Buyer_Zip"):
+        df[zip_col] = df[zip_col].apply(_pad_zip)
+
+    df[splitter.UNIT_COL] = (
+        pd.to_numeric(df[splitter.TOTAL_COL], errors="coerce") /
+        pd.to_numeric(df[splitter.QTY_COL],   errors="coerce")
+    ).round(2)
+    return df
+
+
+# ───────────────── benchmarks ─────────────────────────────────
+def _check_reader(path: str | Path) -> pd.DataFrame:
+    """read_packing_list's frame; raises unless it agrees with the two-pass read."""
+    mawb_a, raw_a = _legacy_read(str(path))
+    mawb_b, raw_b = splitter.read_packing_list(str(path))
+    if mawb_a != mawb_b:
+        raise AssertionError(f"MAWB mismatch: {mawb_a!r} != {mawb_b!r}")
+    pd.testing.assert_frame_equal(raw_a, raw_b)
+    return raw_b
+
+
+def _with_summary_tab(path: str, out: Path) -> Path:
+    """Copy of *path* with a second, active "Summary" sheet."""
+    wb = load_workbook(path)
+    ws = wb.create_sheet("Summary")
+    ws["A1"] = "Totals"
+    wb.active = ws
+    wb.save(out)
+    return out
+
+
+def bench_reader(path: str, repeat: int = 3) -> dict:
+    """
+    Compare the two-pass and single-open readers on *path*, and on a
+    copy saved with another sheet active (the table is still sheet 0).
+    """
+    raw = _check_reader(path)
+    with tempfile.TemporaryDirectory() as tmp:
+        _check_reader(_with_summary_tab(path, Path(tmp) / "summary_tab.xlsx"))
+
+    legacy = _best_of(lambda: _legacy_read(path), repeat)
+    single = _best_of(lambda: splitter.read_packing_list(path), repeat)
+    return {
+        "rows":    len(raw),
+        "legacy_s": round(legacy, 4),
+        "single_s": round(single, 4),
+        "speedup": round(legacy / single, 2) if single else None,
+    }
+
+
+def bench_transform(path: str, rows: int = 100_000, repeat: int = 3) -> dict:
+    """Compare the legacy and vectorised transforms on ~*rows* rows."""
+    _, raw = splitter.read_packing_list(path)
+    if len(raw):
+        raw = pd.concat([raw] * -(-rows // len(raw)), ignore_index=True)
+    pd.testing.assert_frame_equal(splitter.transform_raw(raw),
+                                  _legacy_transform(raw), check_exact=True)
+
+    legacy = _best_of(lambda: _legacy_transform(raw), repeat)
+    vector = _best_of(lambda: splitter.transform_raw(raw), repeat)
+    return {
+        "rows":     len(raw),
+        "legacy_s": round(legacy, 4),
+        "vector_s": round(vector, 4),
+        "speedup":  round(legacy / vector, 2) if vector else None,
+    }
+
+
+def bench_writer(path: str, rows: int = splitter.ROWS_PER_FILE,
+                 repeat: int = 3) -> dict:
+    """Time save_chunks with the pandas and the direct xlsxwriter engine."""
+    mawb, raw = splitter.read_packing_list(path)
+    df = splitter.transform_raw(raw)
+    splitter.load_template()                       # warm the header cache
+
+    def _run(engine: str) -> float:
+        with tempfile.TemporaryDirectory() as tmp:
+            return _best_of(
+                lambda: splitter.save_chunks(df, tmp, mawb, rows,
+                                             enforce_floor=True,
+                                             engine=engine),
+                repeat,
+            )
+
+    legacy = _run("pandas")
+    direct = _run("xlsxwriter")
+    return {
+        "rows":     len(df),
+        "pandas_s": round(legacy, 4),
+        "direct_s": round(direct, 4),
+        "speedup":  round(legacy / direct, 2) if direct else None,
+    }
+
+
+def bench_memory(path: str, rows: int = splitter.ROWS_PER_FILE) -> dict:
+    """Frame footprint before/after compact_frame and the split's peak."""
+    with splitter.memory_report("read + transform") as prep:
+        mawb, raw = splitter.read_packing_list(path)
+        df = splitter.transform_raw(raw)
+        del raw
+    compact = splitter.compact_frame(df)
+    write: dict = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        splitter.save_chunks(compact, tmp, mawb, rows, engine="xlsxwriter",
+                             memory_stats=write)
+    return {
+        "rows":          len(df),
+        "frame_bytes":   splitter.frame_memory(df),
+        "compact_bytes": splitter.frame_memory(compact),
+        "prepare_peak_bytes": prep["peak_bytes"],
+        "write_peak_bytes":   write["peak_bytes"],
+    }
+
+
+def _output_cells(out_dir: str | Path) -> dict[str, list[tuple]]:
+    """File name → cell values of every workbook under *out_dir*."""
+    cells = {}
+    for f in sorted(Path(out_dir).rglob("*.xlsx")):
+        wb = load_workbook(f, read_only=True)
+        cells[f.name] = list(wb.active.iter_rows(values_only=True))
+        wb.close()
+    return cells
+
+
+def bench_streaming(path: str, rows: int = splitter.ROWS_PER_FILE) -> dict:
+    """
+    Time read → transform → save_chunks against split_streaming on
+    *path* and raise unless both write the same cells.  A synthetic list
+    whose first part's HS codes all look numeric is checked as well.
+    """
+    def _split(src: str) -> tuple[dict, float, float]:
+        with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+            t0 = time.perf_counter()
+            mawb, raw = splitter.read_packing_list(src)
+            splitter.save_chunks(splitter.transform_raw(raw), a, mawb, rows)
+            t1 = time.perf_counter()
+            splitter.split_streaming(src, b, rows)
+            t2 = time.perf_counter()
+            whole, streamed = _output_cells(a), _output_cells(b)
+        if whole != streamed:
+            bad = sorted(n for n in whole.keys() | streamed.keys()
+                         if whole.get(n) != streamed.get(n))
+            raise AssertionError(f"{Path(src).name}: streaming output differs in {bad}")
+        return whole, t1 - t0, t2 - t1
+
+    splitter.load_template()
+    with tempfile.TemporaryDirectory() as tmp:
+        mixed = make_packing_list(Path(tmp) / "text_tariffs.xlsx", rows * 3,
+                                  text_tariffs=rows + rows // 2)
+        _split(str(mixed))
+    cells, whole_s, stream_s = _split(path)
+    return {
+        "files":    len(cells),
+        "whole_s":  round(whole_s, 4),
+        "stream_s": round(stream_s, 4),
+    }
+
+
+# ───────────────── synthetic packing lists ────────────────────
+LAYOUTS     = ("legacy", "commodity")
+SUITE_SIZES = (1_000, 10_000, 100_000, 500_000)
+
+# source columns A…M of the legacy layout (see splitter.MAPPING)
+_LEGACY_COLS = [
+    "No.", "HS Code", "Product Name", "Quantity", "Gross Weight (KG)",
+    "Total Value (USD)", "Manufacturer", "Manufacturer Address",
+    "Manufacturer City", "Province", "Postal Code", "Country", "MID",
+]
+_CITIES  = ["Shenzhen", "Yiwu", "Guangzhou", "Ningbo", "Dongguan"]
+_TARIFFS = ["8471.30.0100", "6109.10.0012", "9503.00.0073", 8517620090]
+
+
+def make_packing_list(path: str | Path, rows: int, layout: str = "legacy",
+                      *, seed: int = 0, mawb: str = "999-12345675",
+                      text_tariffs: int = 0) -> Path:
+    """
+    Write a synthetic packing list the splitter can consume.
+
+    Title block on top, MAWB in U9, header row 10, *rows* data lines
+    from row 11 with the odd blank line, sub-$0.51 values for the
+    floor bump, numeric and text ZIPs and SG/HK/CN MIDs.  The first
+    *text_tariffs* lines carry the digits-only text HS code "0101210000".
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout: {layout!r}")
+    rnd  = random.Random(seed)
+    path = Path(path)
+
+    makers = [(f"Maker {i} Co., Ltd", f"No. {rnd.randint(1, 999)} Industrial Rd",
+               rnd.choice(_CITIES), rnd.choice([518000, "322000", 523000.0, "51-800"]),
+               rnd.choice(["CN", "SG", "HK"]) + f"MAK{rnd.randint(100, 999)}"
+               + rnd.choice(_CITIES)[:3].upper())
+              for i in range(200)]
+
+    wb = xlsxwriter.Workbook(str(path), {"constant_memory": True})
+    ws = wb.add_worksheet()
+    ws.write(0, 0, "COMMERCIAL INVOICE / PACKING LIST")
+    ws.write(8, splitter.MAWB_COL - 1, "MAWB:")
+    ws.write(8, splitter.MAWB_COL, mawb)
+
+    header = list(_LEGACY_COLS)
+    if layout == "commodity":
+        header.insert(2, "Commodity Description")
+    ws.write_row(splitter.HEADER_ROWS, 0, header)
+
+    r = splitter.HEADER_ROWS + 1
+    for i in range(rows):
+        if i and i % 250 == 0:
+            r += 1                                  # blank spacer line
+        name, addr, city, zip_, mid = rnd.choice(makers)
+        qty   = rnd.randint(1, 60)
+        value = rnd.choice([0.2, 0.45, round(rnd.uniform(0.5, 400), 2)])
+        hs    = "0101210000" if i < text_tariffs else rnd.choice(_TARIFFS)
+        line  = [i + 1, hs, f"Item {rnd.randint(1, 5000)}",
+                 qty, round(rnd.uniform(0.05, 25), 2), value,
+                 name, addr, city, "Guangdong", zip_, "CN", mid]
+        if layout == "commodity":
+            line.insert(2, rnd.choice(["Plastic toy", "Cotton T-shirt",
+                                       "USB cable", "Phone case"]))
+        ws.write_row(r, 0, line)
+        r += 1
+    wb.close()
+    return path
+
+
+# ───────────────── per-stage suite ────────────────────────────
+def _peak_rss() -> int | None:
+    """Process-lifetime peak resident set size in bytes (None if unknown)."""
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class _PMC(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (n, ctypes.c_size_t) for n in (
+                    "PeakWorkingSetSize", "WorkingSetSize",
+                    "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage",
+                    "PagefileUsage", "PeakPagefileUsage")]
+
+        pmc = _PMC(cb=ctypes.sizeof(_PMC))
+        ok = ctypes.windll.psapi.GetProcessMemoryInfo(
+            ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(pmc), pmc.cb)
+        return pmc.PeakWorkingSetSize if ok else None
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _rows_per_file(n: int) -> int:
+    """Default part size, grown so *n* rows fit the 26 single-letter parts."""
+    if n <= splitter.ROWS_PER_FILE * 52:
+        return splitter.ROWS_PER_FILE
+    return max(600, -(-n // 26))
+
+
+def run_stages(path: str | Path, *, rows_per_file: int | None = None,
+               engine: str = "xlsxwriter") -> dict:
+    """
+    Time each splitter stage on *path* once and report peak RSS.
+
+    Stages: MAWB read (get_mawb), parse (read_packing_list), transform,
+    floor adjust (per-chunk _apply_floor) and write (save_chunks with
+    the floor already applied).
+    """
+    stages = {}
+
+    def _timed(name, fn, *args):
+        t0 = time.perf_counter()
+        out = fn(*args)
+        stages[name] = round(time.perf_counter() - t0, 4)
+        return out
+
+    splitter.load_template()
+    mawb   = _timed("mawb_s", lambda: splitter.get_mawb(str(path)))
+    _, raw = _timed("parse_s", lambda: splitter.read_packing_list(str(path)))
+    df     = _timed("transform_s", splitter.transform_raw, raw)
+    del raw
+
+    rows = rows_per_file or _rows_per_file(len(df))
+
+    def _floor():
+        parts = []
+        for start in range(0, len(df), rows):
+            chunk = df.iloc[start : start + rows].copy()
+            splitter._apply_floor(chunk)
+            parts.append(chunk)
+        return pd.concat(parts) if parts else df
+
+    floored = _timed("floor_s", _floor)
+    with tempfile.TemporaryDirectory() as tmp:
+        n_parts = _timed("write_s", lambda: splitter.save_chunks(
+            floored, tmp, mawb, rows, enforce_floor=False, engine=engine))
+
+    return {
+        "file":        Path(path).name,
+        "rows":        len(df),
+        "parts":       n_parts,
+        "rows_per_file": rows,
+        "engine":      engine,
+        "stages":      stages,
+        "total_s":     round(sum(stages.values()), 4),
+        "peak_rss_bytes": _peak_rss(),
+        "python":      platform.python_version(),
+        "pandas":      pd.__version__,
+    }
+
+
+def run_suite(out: str | Path, sizes=SUITE_SIZES, layouts=LAYOUTS, *,
+              workdir: str | Path | None = None, engine: str = "xlsxwriter",
+              seed: int = 0) -> list[dict]:
+    """
+    Generate (or reuse) one list per size × layout and `run` each in a
+    fresh interpreter, so peak RSS belongs to that case alone.
+    Results are appended to *out* as JSON lines.
+    """
+    workdir = Path(workdir or Path(tempfile.gettempdir()) / "splitter_bench")
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    for size in sizes:
+        for layout in layouts:
+            src = workdir / f"pl_{layout}_{size}_s{seed}.xlsx"
+            if not src.exists():
+                make_packing_list(src, size, layout, seed=seed)
+            proc = subprocess.run(
+                [sys.executable, __file__, "run", str(src), "--engine", engine],
+                capture_output=True, text=True, check=True,
+            )
+            res = json.loads(proc.stdout.strip().splitlines()[-1])
+            res.update(size=size, layout=layout)
+            results.append(res)
+            with open(out, "a", encoding="utf-8") as f:
+                f.write(json.dumps(res) + "\n")
+            print(f"{layout:>9} {size:>7} rows | " + " ".join(
+                f"{k[:-2]} {v:.2f}s" for k, v in res["stages"].items()
+            ) + f" | peak {(res['peak_rss_bytes'] or 0) / 2**20:.0f} MiB")
+    return results
+
+
+def compare_runs(old: str | Path, new: str | Path,
+                 tolerance: float = 1.2) -> list[str]:
+    """Stages in *new* slower than *tolerance* × *old* (last run per case)."""
+    def _load(p):
+        with open(p, encoding="utf-8") as f:
+            return {(r["layout"], r["size"]): r for r in map(json.loads, f)}
+
+    before, after = _load(old), _load(new)
+    slower = []
+    for key in sorted(before.keys() & after.keys()):
+        a, b = before[key]["stages"], after[key]["stages"]
+        for stage in a.keys() & b.keys():
+            if a[stage] > 0 and b[stage] > a[stage] * tolerance:
+                slower.append(f"{key[0]} {key[1]} {stage}: "
+                              f"{a[stage]:.3f}s → {b[stage]:.3f}s")
+    return slower
+
+
+# ───────────────── CLI ────────────────────────────────────────
+def main(argv=None) -> None:
+    ap  = argparse.ArgumentParser(description=__doc__,
+                                  formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    rd = sub.add_parser("reader", help="two-pass vs single-open read")
+    rd.add_argument("path")
+    rd.add_argument("--repeat", type=int, default=3)
+
+    tf = sub.add_parser("transform", help="legacy vs vectorised transform")
+    tf.add_argument("path")
+    tf.add_argument("--rows", type=int, default=100_000)
+    tf.add_argument("--repeat", type=int, default=3)
+
+    wr = sub.add_parser("writer", help="pandas vs direct xlsxwriter output")
+    wr.add_argument("path")
+    wr.add_argument("--rows-per-file", type=int, default=splitter.ROWS_PER_FILE)
+    wr.add_argument("--repeat", type=int, default=3)
+
+    mm = sub.add_parser("memory", help="frame footprint and split peak")
+    mm.add_argument("path")
+    mm.add_argument("--rows-per-file", type=int, default=splitter.ROWS_PER_FILE)
+
+    sm = sub.add_parser("streaming", help="save_chunks vs split_streaming output")
+    sm.add_argument("path")
+    sm.add_argument("--rows-per-file", type=int, default=splitter.ROWS_PER_FILE)
+
+    gn = sub.add_parser("generate", help="write a synthetic packing list")
+    gn.add_argument("out")
+    gn.add_argument("--rows", type=int, default=20_000)
+    gn.add_argument("--layout", choices=LAYOUTS, default="legacy")
+    gn.add_argument("--seed", type=int, default=0)
+    gn.add_argument("--text-tariffs", type=int, default=0)
+
+    rn = sub.add_parser("run", help="per-stage timings for one file (JSON)")
+    rn.add_argument("path")
+    rn.add_argument("--rows-per-file", type=int)
+    rn.add_argument("--engine", choices=splitter.WRITE_ENGINES, default="xlsxwriter")
+
+    st = sub.add_parser("suite", help="size × layout grid to JSON lines")
+    st.add_argument("--out", required=True)
+    st.add_argument("--sizes", type=int, nargs="+", default=list(SUITE_SIZES))
+    st.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=list(LAYOUTS))
+    st.add_argument("--workdir")
+    st.add_argument("--engine", choices=splitter.WRITE_ENGINES, default="xlsxwriter")
+    st.add_argument("--seed", type=int, default=0)
+
+    cp = sub.add_parser("compare", help="regressions between two suite files")
+    cp.add_argument("old")
+    cp.add_argument("new")
+    cp.add_argument("--tolerance", type=float, default=1.2)
+
+    args = ap.parse_args(argv)
+    if args.cmd == "reader":
+        res = bench_reader(args.path, args.repeat)
+        print(f"{res['rows']} rows | two-pass {res['legacy_s']:.3f}s | "
+              f"single-open {res['single_s']:.3f}s | ×{res['speedup']}")
+    elif args.cmd == "transform":
+        res = bench_transform(args.path, args.rows, args.repeat)
+        print(f"{res['rows']} rows | legacy {res['legacy_s']:.3f}s | "
+              f"vectorised {res['vector_s']:.3f}s | ×{res['speedup']}")
+    elif args.cmd == "writer":
+        res = bench_writer(args.path, args.rows_per_file, args.repeat)
+        print(f"{res['rows']} rows | pandas {res['pandas_s']:.3f}s | "
+              f"xlsxwriter {res['direct_s']:.3f}s | ×{res['speedup']}")
+    elif args.cmd == "memory":
+        res = bench_memory(args.path, args.rows_per_file)
+        mib = {k: v / 2**20 for k, v in res.items() if k.endswith("bytes")}
+        print(f"{res['rows']} rows | frame {mib['frame_bytes']:.1f} MiB → "
+              f"compact {mib['compact_bytes']:.1f} MiB | "
+              f"peaks: prepare {mib['prepare_peak_bytes']:.1f} MiB, "
+              f"write {mib['write_peak_bytes']:.1f} MiB")
+    elif args.cmd == "streaming":
+        res = bench_streaming(args.path, args.rows_per_file)
+        print(f"{res['files']} files identical | whole {res['whole_s']:.3f}s | "
+              f"streaming {res['stream_s']:.3f}s")
+    elif args.cmd == "generate":
+        make_packing_list(args.out, args.rows, args.layout, seed=args.seed,
+                          text_tariffs=args.text_tariffs)
+    elif args.cmd == "run":
+        print(json.dumps(run_stages(args.path, rows_per_file=args.rows_per_file,
+                                    engine=args.engine)))
+    elif args.cmd == "suite":
+        run_suite(args.out, args.sizes, args.layouts, workdir=args.workdir,
+                  engine=args.engine, seed=args.seed)
+    elif args.cmd == "compare":
+        slower = compare_runs(args.old, args.new, args.tolerance)
+        print("\n".join(slower) or "no regressions")
+        sys.exit(1 if slower else 0)
+
+
+if __name__ == "__main__":
+    main()